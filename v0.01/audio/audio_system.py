@@ -1,12 +1,36 @@
 #!/usr/bin/env python3
 import pygame
+import numpy as np
 import random
 import os
-import math
+import tempfile
+import threading
+import zipfile
+from collections import defaultdict
+
+
+def _clamp01(value):
+    """Clamp a volume to [0.0, 1.0] with plain comparisons instead of max/min calls"""
+    # Written so NaN fails the first test and maps to 0.0 instead of reaching the mixer
+    if not value > 0.0:
+        return 0.0
+    return 1.0 if value > 1.0 else value
+
 
 class AudioSystem:
     """Manages all game audio - sound effects and music"""
     
+    # Shared sine wavetable for procedural tone generation
+    SAMPLE_RATE = 44100
+    SIN_LUT_SIZE = 1024
+    _SIN_LUT = np.sin(2 * np.pi * np.arange(SIN_LUT_SIZE) / SIN_LUT_SIZE).astype(np.float32)
+    _PHASE_PER_HZ = SIN_LUT_SIZE / SAMPLE_RATE  # LUT steps per sample for a 1 Hz tone
+    
+    # On-disk cache of synthesized placeholder sounds (bump version when synthesis changes)
+    PLACEHOLDER_SOUND_NAMES = ('explosion', 'cannon', 'energy_charge', 'impact', 'shield_hit', 'engine')
+    PLACEHOLDER_CACHE_VERSION = 5
+    PLACEHOLDER_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', '2Dshooter', 'placeholder_sounds.npz')
+    
     def __init__(self):
         # Initialize pygame mixer
         pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
@@ -20,7 +44,11 @@ class AudioSystem:
         
         # Sound effect containers
         self.sound_cache = {}  # Loaded sound files
-        self.playing_sounds = []  # Currently playing sounds
+        self.playing_sounds = {}  # Currently playing sounds by voice id
+        self.sounds_by_name = defaultdict(set)  # Sound name -> voice ids
+        self.sounds_by_category = defaultdict(set)  # Category -> voice ids
+        self.next_voice_id = 0
+        self.frame_ticks = pygame.time.get_ticks()  # Mixer clock, refreshed once per update()
         
         # Music system
         self.current_music = None
@@ -37,90 +65,147 @@ class AudioSystem:
             'ambient': 0.4
         }
         
-        # Generated sounds (procedural audio for when files aren't available)
-        self.generated_sounds = {}
+        # Generated sounds (procedural audio for when files aren't available).
+        # Silent stand-ins are served until update() turns the background thread's sample arrays into sounds
+        silence = pygame.sndarray.make_sound(np.zeros((self.SAMPLE_RATE // 100, 2), dtype=np.int16))
+        self.generated_sounds = dict.fromkeys(self.PLACEHOLDER_SOUND_NAMES, silence)
+        self.pending_sound_arrays = []  # (name, stereo samples) handed over by the generation thread
+        self.pending_sound_lock = threading.Lock()
         
         print("AudioSystem initialized")
-        self._generate_placeholder_sounds()
+        self.sound_generation_thread = threading.Thread(
+            target=self._generate_placeholder_sounds, name="placeholder-sounds", daemon=True
+        )
+        self.sound_generation_thread.start()
     
     def _generate_placeholder_sounds(self):
-        """Generate procedural sound effects when audio files aren't available"""
-        # This creates simple synthesized sounds using pygame
+        """Generate procedural sound sample arrays when audio files aren't available"""
+        # Runs off the main thread, so it only does NumPy work; the mixer is touched in update()
+        buffers = self._load_cached_placeholder_buffers()
+        if buffers is None:
+            buffers = self._synthesize_placeholder_buffers()
+            self._save_cached_placeholder_buffers(buffers)
+        
+        with self.pending_sound_lock:
+            self.pending_sound_arrays.extend(buffers.items())
+    
+    def _publish_generated_sounds(self):
+        """Turn sample arrays finished by the generation thread into mixer sounds on the main thread"""
+        with self.pending_sound_lock:
+            arrays, self.pending_sound_arrays = self.pending_sound_arrays, []
+        for name, samples in arrays:
+            self.generated_sounds[name] = pygame.sndarray.make_sound(samples)
+    
+    def _load_cached_placeholder_buffers(self):
+        """Load previously synthesized placeholder buffers from disk, if present and intact"""
+        try:
+            with np.load(self.PLACEHOLDER_CACHE_PATH) as data:
+                if int(data['version']) != self.PLACEHOLDER_CACHE_VERSION:
+                    return None
+                buffers = {name: np.ascontiguousarray(data[name]) for name in self.PLACEHOLDER_SOUND_NAMES}
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            return None
         
-        # Explosion sound - noise burst with low-pass filter
-        explosion_samples = []
-        for i in range(8820):  # 0.2 seconds at 44100 Hz
-            # White noise with envelope
-            envelope = max(0, 1.0 - (i / 8820))
-            noise = random.uniform(-1, 1) * envelope * 0.3
-            explosion_samples.append([int(noise * 32767), int(noise * 32767)])
+        # Anything but non-empty stereo int16 samples means a damaged or foreign file: regenerate
+        for samples in buffers.values():
+            if samples.dtype != np.int16 or samples.ndim != 2 or samples.shape[1] != 2 or samples.size == 0:
+                return None
+        return buffers
+    
+    def _save_cached_placeholder_buffers(self, buffers):
+        """Write synthesized placeholder buffers to disk for the next launch"""
+        # Written to a temp file beside the cache and renamed over it, so an interrupted
+        # write never leaves a truncated cache behind
+        cache_dir = os.path.dirname(self.PLACEHOLDER_CACHE_PATH)
+        temp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix='.npz.tmp', dir=cache_dir)
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, version=self.PLACEHOLDER_CACHE_VERSION, **buffers)
+            os.replace(temp_path, self.PLACEHOLDER_CACHE_PATH)
+        except OSError as e:
+            print(f"Could not cache placeholder sounds: {e}")
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+    
+    def _synthesize_placeholder_buffers(self):
+        """Synthesize placeholder sounds as stereo int16 sample arrays"""
+        # Synthesized with NumPy array ops - pygame.sndarray needs NumPy anyway.
+        # Envelopes need no clamp since t / n stays below 1 for every sample
+        # Fixed seed keeps the noise reproducible between cached and fresh runs
+        rng = np.random.default_rng(0)
+        buffers = {}
         
-        explosion_sound = pygame.sndarray.make_sound(explosion_samples)
-        self.generated_sounds['explosion'] = explosion_sound
+        # Explosion sound - noise burst with low-pass filter
+        n = 8820  # 0.2 seconds at 44100 Hz
+        t = np.arange(n, dtype=np.float32)
+        envelope = 1.0 - t / n
+        noise = rng.uniform(-1, 1, n).astype(np.float32) * envelope * 0.3
+        buffers['explosion'] = self._to_stereo_samples(noise)
         
         # Cannon fire - sharp pop with decay
-        cannon_samples = []
-        for i in range(2205):  # 0.05 seconds
-            envelope = max(0, 1.0 - (i / 2205) ** 0.3)
-            freq = 200 + (100 * envelope)
-            wave = math.sin(2 * math.pi * freq * i / 44100) * envelope * 0.4
-            cannon_samples.append([int(wave * 32767), int(wave * 32767)])
-        
-        cannon_sound = pygame.sndarray.make_sound(cannon_samples)
-        self.generated_sounds['cannon'] = cannon_sound
+        n = 2205  # 0.05 seconds
+        t = np.arange(n, dtype=np.float32)
+        envelope = 1.0 - (t / n) ** 0.3
+        freq = 200 + (100 * envelope)
+        wave = self._tone(freq, t) * envelope * 0.4
+        buffers['cannon'] = self._to_stereo_samples(wave)
         
         # Energy charge - rising tone
-        charge_samples = []
-        for i in range(22050):  # 0.5 seconds
-            progress = i / 22050
-            freq = 100 + (300 * progress)
-            envelope = math.sin(math.pi * progress) * 0.3
-            wave = math.sin(2 * math.pi * freq * i / 44100) * envelope
-            charge_samples.append([int(wave * 32767), int(wave * 32767)])
-        
-        charge_sound = pygame.sndarray.make_sound(charge_samples)
-        self.generated_sounds['energy_charge'] = charge_sound
+        n = 22050  # 0.5 seconds
+        t = np.arange(n, dtype=np.float32)
+        progress = t / n
+        freq = 100 + (300 * progress)
+        envelope = np.sin(np.pi * progress) * 0.3
+        wave = self._tone(freq, t) * envelope
+        buffers['energy_charge'] = self._to_stereo_samples(wave)
         
         # Impact hit - short metallic clang
-        impact_samples = []
-        for i in range(1102):  # 0.025 seconds
-            envelope = max(0, 1.0 - (i / 1102) ** 0.1)
-            # Multiple frequencies for metallic sound
-            wave = 0
-            for freq in [800, 1200, 1600]:
-                wave += math.sin(2 * math.pi * freq * i / 44100) * envelope * 0.1
-            impact_samples.append([int(wave * 32767), int(wave * 32767)])
-        
-        impact_sound = pygame.sndarray.make_sound(impact_samples)
-        self.generated_sounds['impact'] = impact_sound
+        n = 1102  # 0.025 seconds
+        t = np.arange(n, dtype=np.float32)
+        envelope = 1.0 - (t / n) ** 0.1
+        # Multiple frequencies for metallic sound - unrolled so each harmonic is a
+        # single scalar-step LUT gather sharing one scaled envelope
+        wave = (self._tone(800, t) + self._tone(1200, t) + self._tone(1600, t)) * (envelope * 0.1)
+        buffers['impact'] = self._to_stereo_samples(wave)
         
         # Shield hit - electric zap
-        shield_samples = []
-        for i in range(3307):  # 0.075 seconds
-            envelope = max(0, 1.0 - (i / 3307))
-            # High frequency noise for electric effect
-            noise = random.uniform(-1, 1) * envelope * 0.2
-            freq_mod = 50 + random.uniform(-10, 10)
-            wave = math.sin(2 * math.pi * freq_mod * i / 44100) * envelope * 0.1
-            combined = (noise + wave) * 0.5
-            shield_samples.append([int(combined * 32767), int(combined * 32767)])
-        
-        shield_sound = pygame.sndarray.make_sound(shield_samples)
-        self.generated_sounds['shield_hit'] = shield_sound
+        n = 3307  # 0.075 seconds
+        t = np.arange(n, dtype=np.float32)
+        envelope = 1.0 - t / n
+        # High frequency noise for electric effect
+        noise = rng.uniform(-1, 1, n).astype(np.float32) * envelope * 0.2
+        freq_mod = 50 + rng.uniform(-10, 10, n).astype(np.float32)
+        wave = self._tone(freq_mod, t) * envelope * 0.1
+        buffers['shield_hit'] = self._to_stereo_samples((noise + wave) * 0.5)
         
         # Engine thrust - low rumble
-        engine_samples = []
-        for i in range(44100):  # 1 second loop
-            # Low frequency rumble
-            base_freq = 80
-            wave = 0
-            wave += math.sin(2 * math.pi * base_freq * i / 44100) * 0.3
-            wave += math.sin(2 * math.pi * (base_freq * 1.5) * i / 44100) * 0.2
-            wave += random.uniform(-0.1, 0.1)  # Add some noise
-            engine_samples.append([int(wave * 32767 * 0.3), int(wave * 32767 * 0.3)])
-        
-        engine_sound = pygame.sndarray.make_sound(engine_samples)
-        self.generated_sounds['engine'] = engine_sound
+        n = 44100  # 1 second loop
+        t = np.arange(n, dtype=np.float32)
+        base_freq = 80
+        wave = self._tone(base_freq, t) * 0.3
+        wave += self._tone(base_freq * 1.5, t) * 0.2
+        wave += rng.uniform(-0.1, 0.1, n).astype(np.float32)  # Add some noise
+        buffers['engine'] = self._to_stereo_samples(wave * 0.3)
+        
+        return buffers
+    
+    @classmethod
+    def _tone(cls, freq, t):
+        """Sine tone at freq Hz over sample indices t, looked up from the wavetable"""
+        # Fold the phase step into freq first so constant tones take a single array multiply
+        phase = np.multiply(t, np.multiply(freq, cls._PHASE_PER_HZ), dtype=np.float64)
+        return cls._SIN_LUT[phase.astype(np.int64) & (cls.SIN_LUT_SIZE - 1)]
+    
+    @staticmethod
+    def _to_stereo_samples(wave):
+        """Convert a mono float waveform in [-1, 1] to a stereo int16 sample array"""
+        samples = (wave * 32767).astype(np.int16)
+        return np.ascontiguousarray(np.stack([samples, samples], axis=1))
     
     def load_sound(self, sound_name, file_path, category='sfx'):
         """Load a sound file into cache"""
@@ -182,14 +267,22 @@ class AudioSystem:
             if channel:
                 channel.set_volume(final_volume)
                 
-                # Store reference for management
+                # Store reference for management; one-shot sounds expire by
+                # their known length so update() never has to poll the mixer
+                start_time = self.frame_ticks
+                end_time = None if loop else start_time + int(sound.get_length() * 1000)
                 sound_info = {
                     'channel': channel,
                     'name': sound_name,
                     'category': category,
-                    'start_time': pygame.time.get_ticks()
+                    'start_time': start_time,
+                    'end_time': end_time
                 }
-                self.playing_sounds.append(sound_info)
+                voice_id = self.next_voice_id
+                self.next_voice_id += 1
+                self.playing_sounds[voice_id] = sound_info
+                self.sounds_by_name[sound_name].add(voice_id)
+                self.sounds_by_category[category].add(voice_id)
                 
                 return channel
         except Exception as e:
@@ -199,17 +292,20 @@ class AudioSystem:
     
     def stop_sound(self, sound_name):
         """Stop all instances of a specific sound"""
-        for sound_info in self.playing_sounds[:]:
-            if sound_info['name'] == sound_name:
-                sound_info['channel'].stop()
-                self.playing_sounds.remove(sound_info)
+        for voice_id in list(self.sounds_by_name.get(sound_name, ())):
+            self._forget_sound(voice_id)['channel'].stop()
     
     def stop_category(self, category):
         """Stop all sounds in a category"""
-        for sound_info in self.playing_sounds[:]:
-            if sound_info['category'] == category:
-                sound_info['channel'].stop()
-                self.playing_sounds.remove(sound_info)
+        for voice_id in list(self.sounds_by_category.get(category, ())):
+            self._forget_sound(voice_id)['channel'].stop()
+    
+    def _forget_sound(self, voice_id):
+        """Drop a voice from playing_sounds and its indexes, returning its info"""
+        sound_info = self.playing_sounds.pop(voice_id)
+        self.sounds_by_name[sound_info['name']].discard(voice_id)
+        self.sounds_by_category[sound_info['category']].discard(voice_id)
+        return sound_info
     
     def play_explosion(self, size=1.0, explosion_type="standard"):
         """Play explosion sound with size/type variation"""
@@ -320,7 +416,7 @@ class AudioSystem:
     
     def set_master_volume(self, volume):
         """Set master volume (0.0 to 1.0)"""
-        self.master_volume = max(0.0, min(1.0, volume))
+        self.master_volume = _clamp01(volume)
         
         # Update currently playing music
         if pygame.mixer.music.get_busy():
@@ -328,17 +424,26 @@ class AudioSystem:
     
     def set_category_volume(self, category, volume):
         """Set volume for a specific category"""
-        self.category_volumes[category] = max(0.0, min(1.0, volume))
+        self.category_volumes[category] = _clamp01(volume)
     
     def update(self, delta_time):
         """Update audio system (clean up finished sounds)"""
+        if self.pending_sound_arrays:
+            self._publish_generated_sounds()
+        
         if not self.enabled:
             return
         
-        # Clean up finished sounds
-        for sound_info in self.playing_sounds[:]:
-            if not sound_info['channel'].get_busy():
-                self.playing_sounds.remove(sound_info)
+        # Sample the clock once per tick for everything played this frame
+        self.frame_ticks = current_time = pygame.time.get_ticks()
+        
+        # Clean up finished sounds (looped sounds live until stopped)
+        finished = [
+            voice_id for voice_id, sound_info in self.playing_sounds.items()
+            if sound_info['end_time'] is not None and sound_info['end_time'] <= current_time
+        ]
+        for voice_id in finished:
+            self._forget_sound(voice_id)
         
         # Update music fade if needed
         if self.music_fade_timer > 0:
@@ -357,12 +462,16 @@ class AudioSystem:
     
     def stop_all_sounds(self):
         """Stop all currently playing sounds"""
-        for sound_info in self.playing_sounds:
+        for sound_info in self.playing_sounds.values():
             sound_info['channel'].stop()
         self.playing_sounds.clear()
+        self.sounds_by_name.clear()
+        self.sounds_by_category.clear()
     
     def cleanup(self):
         """Clean up audio system resources"""
+        # Daemon thread: give it a moment to finish, but never block exit on a stalled generation
+        self.sound_generation_thread.join(timeout=1.0)
         self.stop_all_sounds()
         self.stop_music()
         self.sound_cache.clear()
@@ -394,7 +503,7 @@ class AudioManager:
     
     def on_explosion(self, position, size=1.0, explosion_type="standard"):
         """Handle explosion audio"""
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = self.audio_system.frame_ticks / 1000.0
         
         # Prevent audio spam from multiple simultaneous explosions
         if current_time - self.last_explosion_time < self.explosion_cooldown:
@@ -1,11 +1,103 @@
 #!/usr/bin/env python3
 import math
+import functools
+from dataclasses import dataclass
+
+
+# Scalar damage kernels - kept at module level and fed plain floats so the
+# per-hit path avoids dict lookups and class attribute dispatch. Warhead
+# constants are precomputed once per Warhead record
+
+def _calculate_pressure_damage(available_energy, diameter_efficiency, distance):
+    """Calculate explosive pressure wave damage in pure joules"""
+    # Energy distribution follows inverse square law with distance
+    effective_distance = max(1.0, distance / diameter_efficiency)
+    
+    # Energy delivered to target position - PURE JOULES
+    return available_energy / (effective_distance * effective_distance)
+
+def _calculate_shrapnel_damage(total_kinetic_energy, fragment_count, max_shrapnel_range, distance):
+    """Calculate kinetic shrapnel damage in pure joules"""
+    if distance <= 0:
+        distance = 0.1
+    
+    if distance > max_shrapnel_range:
+        return 0.0
+    
+    # Fragment density falloff with distance
+    falloff = max(0, (max_shrapnel_range - distance) / max_shrapnel_range)
+    
+    # Hit probability based on fragment density
+    hit_probability = min(1.0, (fragment_count / 1000.0) * math.sqrt(falloff))
+    
+    # Energy delivered by fragments that hit target - PURE JOULES
+    return total_kinetic_energy * hit_probability * falloff
+
+@functools.lru_cache(maxsize=256)
+def _calculate_fragment_count(shrapnel_mass, diameter_mm, length_mm):
+    """Calculate number of fragments based on physical properties (memoized per warhead type)"""
+    # Calculate shell surface area
+    diameter_m = diameter_mm / 1000.0
+    length_m = length_mm / 1000.0
+    
+    # Surface area = cylindrical surface + end caps
+    cylindrical_area = math.pi * diameter_m * length_m
+    radius_m = diameter_m / 2
+    end_caps_area = 2 * math.pi * radius_m * radius_m
+    total_surface_area = cylindrical_area + end_caps_area
+    
+    # Fragment density for military ordnance
+    fragments_per_m2 = 3000
+    base_fragment_count = total_surface_area * fragments_per_m2
+    
+    # Minimum viable fragment mass constraint
+    min_fragment_mass = 0.0005  # 0.5 grams
+    max_fragments_by_mass = shrapnel_mass / min_fragment_mass
+    
+    # Aspect ratio affects fragmentation
+    aspect_ratio = length_m / diameter_m
+    if aspect_ratio > 3:
+        fragmentation_efficiency = 0.8  # Long, thin
+    elif aspect_ratio < 1.5:
+        fragmentation_efficiency = 1.2  # Short, wide
+    else:
+        fragmentation_efficiency = 1.0  # Standard
+    
+    base_fragment_count *= fragmentation_efficiency
+    fragment_count = min(base_fragment_count, max_fragments_by_mass)
+    
+    return max(1, int(fragment_count))
+
+
+@dataclass(slots=True, frozen=True)
+class Warhead:
+    """Immutable warhead record with its precomputed damage constants"""
+    # Physical properties
+    explosive_kg: float
+    shrapnel_percent: float
+    total_mass: float
+    velocity: float  # m/s
+    diameter_mm: float
+    length_mm: float
+    shrapnel_kg: float
+    
+    # Distance-independent damage terms
+    diameter_efficiency: float
+    max_damage_radius: float
+    available_energy: float
+    fragment_count: int
+    fragment_mass: float
+    kinetic_energy_per_fragment: float
+    total_kinetic_energy: float
+    max_shrapnel_range: float
+
 
 class DamageCalculator:
     """Pure physics-based damage calculation using raw joules - NO SCALING FACTORS"""
     
     # Physics constants
     EXPLOSIVE_JOULES_PER_KG = 4184000  # TNT equivalent
+    KMH_TO_MS = 1000 / 3600
     PROXIMITY_FUSE_RADIUS = 20
     
     @staticmethod
@@ -14,149 +106,68 @@ class DamageCalculator:
         return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
     
     @staticmethod
-    def calculate_explosion_damage(explosion_center, target_pos, warhead_data):
+    def calculate_explosion_damage(explosion_center, target_pos, warhead):
         """
         Calculate damage from explosive using pure joules - NO SCALING
         
         Args:
             explosion_center: (x, y) position of explosion
             target_pos: (x, y) position of target
-            warhead_data: dict with explosive_kg, shrapnel data, velocity, diameter_mm
+            warhead: Warhead record from create_warhead_data_from_db
         
         Returns:
             total_damage: raw joules of energy delivered to target
         """
-        distance = DamageCalculator.calculate_distance(explosion_center, target_pos)
-        
-        # Calculate effective damage radius based on warhead properties
-        diameter_m = warhead_data.get("diameter_mm", 50) / 1000.0
-        explosive_kg = warhead_data["explosive_kg"]
-        
-        # Damage radius scales with explosive amount and warhead size
-        base_radius = 50  # Base game units
-        diameter_factor = (diameter_m / 0.05) ** 0.5
-        explosive_factor = (explosive_kg / 0.5) ** 0.3
-        max_damage_radius = base_radius * diameter_factor * explosive_factor
-        
-        if distance > max_damage_radius:
-            return 0.0
-        
-        # Explosive pressure wave damage - PURE JOULES
-        explosive_joules = explosive_kg * DamageCalculator.EXPLOSIVE_JOULES_PER_KG
-        pressure_damage = DamageCalculator._calculate_pressure_damage(
-            explosive_joules, distance, diameter_m
-        )
-        
-        # Kinetic shrapnel damage - PURE JOULES
-        shrapnel_damage = DamageCalculator._calculate_shrapnel_damage(
-            warhead_data, distance, diameter_m
-        )
-        
-        total_damage_joules = pressure_damage + shrapnel_damage
-        return max(0.0, total_damage_joules)
-    
-    @staticmethod
-    def _calculate_pressure_damage(explosive_joules, distance, diameter_m):
-        """Calculate explosive pressure wave damage in pure joules"""
-        if distance <= 0:
-            distance = 0.1
-        
-        # Warhead efficiency based on diameter
-        diameter_efficiency = min(2.0, (diameter_m / 0.05) ** 0.2)
-        
-        # Total explosive energy available
-        available_energy = explosive_joules * diameter_efficiency
-        
-        # Energy distribution follows inverse square law with distance
-        effective_distance = max(1.0, distance / diameter_efficiency)
-        falloff = 1.0 / (effective_distance ** 2)
-        
-        # Energy delivered to target position - PURE JOULES
-        delivered_energy = available_energy * falloff
-        
-        return delivered_energy
+        return DamageCalculator.calculate_explosion_damage_batch(
+            explosion_center, (target_pos,), warhead
+        )[0]
     
     @staticmethod
-    def _calculate_shrapnel_damage(warhead_data, distance, diameter_m):
-        """Calculate kinetic shrapnel damage in pure joules"""
-        if distance <= 0:
-            distance = 0.1
-        
-        # Extract shrapnel properties
-        shrapnel_kg = warhead_data.get("shrapnel_kg", warhead_data["total_mass"] * warhead_data["shrapnel_percent"])
-        projectile_velocity = warhead_data["velocity"]  # m/s
-        diameter_mm = warhead_data.get("diameter_mm", 50)
-        length_mm = warhead_data.get("length_mm", 300)
-        
-        # Calculate fragment properties
-        fragment_count = DamageCalculator._calculate_fragment_count(shrapnel_kg, diameter_mm, length_mm)
-        fragment_mass = shrapnel_kg / fragment_count if fragment_count > 0 else 0
-        
-        # Fragment velocity distribution
-        diameter_factor = diameter_mm / 50.0
-        velocity_spread = 0.3 * diameter_factor
-        min_velocity = projectile_velocity * (1 - velocity_spread)
-        max_velocity = projectile_velocity * (1 + velocity_spread)
-        avg_fragment_velocity = (min_velocity + max_velocity) / 2
-        
-        # Total kinetic energy of all fragments - PURE JOULES
-        # KE = 0.5 * m * v²
-        kinetic_energy_per_fragment = 0.5 * fragment_mass * (avg_fragment_velocity ** 2)
-        total_kinetic_energy = kinetic_energy_per_fragment * fragment_count
-        
-        # Shrapnel effective range
-        base_range = 60
-        dispersion_factor = (diameter_mm / 50.0) ** 0.5
-        energy_factor = (total_kinetic_energy / 1000000) ** 0.2
-        max_shrapnel_range = base_range * dispersion_factor * energy_factor
-        
-        if distance > max_shrapnel_range:
-            return 0.0
-        
-        # Fragment density falloff with distance
-        falloff = max(0, (max_shrapnel_range - distance) / max_shrapnel_range)
-        
-        # Hit probability based on fragment density
-        hit_probability = min(1.0, (fragment_count / 1000.0) * (falloff ** 0.5))
+    def calculate_explosion_damage_batch(explosion_center, target_positions, warhead):
+        """
+        Calculate explosive damage for many targets at once - NO SCALING
         
-        # Energy delivered by fragments that hit target - PURE JOULES
-        delivered_shrapnel_energy = total_kinetic_energy * hit_probability * falloff
+        Warhead-dependent terms are evaluated once per call instead of once
+        per target, so a blast over a crowd only pays for the distance falloff.
         
-        return delivered_shrapnel_energy
-    
-    @staticmethod
-    def _calculate_fragment_count(shrapnel_mass, diameter_mm, length_mm):
-        """Calculate number of fragments based on physical properties"""
-        # Calculate shell surface area
-        diameter_m = diameter_mm / 1000.0
-        length_m = length_mm / 1000.0
-        
-        # Surface area = cylindrical surface + end caps
-        cylindrical_area = math.pi * diameter_m * length_m
-        end_caps_area = 2 * math.pi * (diameter_m / 2) ** 2
-        total_surface_area = cylindrical_area + end_caps_area
-        
-        # Fragment density for military ordnance
-        fragments_per_m2 = 3000
-        base_fragment_count = total_surface_area * fragments_per_m2
-        
-        # Minimum viable fragment mass constraint
-        min_fragment_mass = 0.0005  # 0.5 grams
-        max_fragments_by_mass = shrapnel_mass / min_fragment_mass
-        
-        # Aspect ratio affects fragmentation
-        aspect_ratio = length_m / diameter_m
-        if aspect_ratio > 3:
-            fragmentation_efficiency = 0.8  # Long, thin
-        elif aspect_ratio < 1.5:
-            fragmentation_efficiency = 1.2  # Short, wide
-        else:
-            fragmentation_efficiency = 1.0  # Standard
+        Args:
+            explosion_center: (x, y) position of explosion
+            target_positions: iterable of (x, y) target positions
+            warhead: Warhead record from create_warhead_data_from_db
         
-        base_fragment_count *= fragmentation_efficiency
-        fragment_count = min(base_fragment_count, max_fragments_by_mass)
+        Returns:
+            list of raw joules delivered to each target, in input order
+        """
+        cx, cy = explosion_center
+        
+        max_damage_radius = warhead.max_damage_radius
+        available_energy = warhead.available_energy
+        diameter_efficiency = warhead.diameter_efficiency
+        total_kinetic_energy = warhead.total_kinetic_energy
+        fragment_count = warhead.fragment_count
+        max_shrapnel_range = warhead.max_shrapnel_range
+        
+        # Range-check on squared distances; only targets inside the blast need the real distance
+        max_damage_radius_sq = max_damage_radius * max_damage_radius
+        damages = []
+        for tx, ty in target_positions:
+            dx = cx - tx
+            dy = cy - ty
+            if dx * dx + dy * dy > max_damage_radius_sq:
+                damages.append(0.0)
+                continue
+            
+            distance = math.hypot(dx, dy)
+            
+            # Explosive pressure wave + kinetic shrapnel damage - PURE JOULES
+            pressure_damage = _calculate_pressure_damage(available_energy, diameter_efficiency, distance)
+            shrapnel_damage = _calculate_shrapnel_damage(
+                total_kinetic_energy, fragment_count, max_shrapnel_range, distance
+            )
+            
+            damages.append(max(0.0, pressure_damage + shrapnel_damage))
         
-        return max(1, int(fragment_count))
+        return damages
     
     @staticmethod
     def calculate_projectile_damage(projectile_data, target_pos=None):
@@ -164,17 +175,19 @@ class DamageCalculator:
         Calculate damage from kinetic projectiles in pure joules - NO SCALING
         
         Args:
-            projectile_data: dict with mass_kg, velocity_kmh
+            projectile_data: dict with mass_kg and velocity_ms (or velocity_kmh)
             target_pos: optional for penetration calculations
         
         Returns:
             kinetic_energy_joules: pure kinetic energy in joules
         """
         mass = projectile_data["mass_kg"]  # kg
-        velocity = projectile_data["velocity_kmh"] * 1000 / 3600  # Convert km/h to m/s
+        velocity = projectile_data.get("velocity_ms")  # m/s, set at spawn
+        if velocity is None:
+            velocity = projectile_data["velocity_kmh"] * DamageCalculator.KMH_TO_MS
         
         # Pure kinetic energy: KE = 0.5 * m * v² - NO SCALING
-        kinetic_energy_joules = 0.5 * mass * (velocity ** 2)
+        kinetic_energy_joules = 0.5 * mass * velocity * velocity
         
         return kinetic_energy_joules
     
@@ -251,11 +264,57 @@ class DamageCalculator:
         
         return max(0.0, damage)
     
+    @staticmethod
+    def _precompute_warhead_terms(explosive_kg, shrapnel_kg, projectile_velocity, diameter_mm, length_mm):
+        """Derive the distance-independent damage terms of a warhead (velocity in m/s)"""
+        diameter_m = diameter_mm / 1000.0
+        
+        # Damage radius scales with explosive amount and warhead size
+        base_radius = 50  # Base game units
+        diameter_ratio = diameter_m / 0.05
+        diameter_factor = math.sqrt(diameter_ratio)
+        explosive_factor = (explosive_kg / 0.5) ** 0.3
+        max_damage_radius = base_radius * diameter_factor * explosive_factor
+        
+        # Warhead efficiency based on diameter, scaling total explosive energy available
+        diameter_efficiency = min(2.0, diameter_ratio ** 0.2)
+        available_energy = explosive_kg * DamageCalculator.EXPLOSIVE_JOULES_PER_KG * diameter_efficiency
+        
+        # Calculate fragment properties
+        fragment_count = _calculate_fragment_count(shrapnel_kg, diameter_mm, length_mm)
+        fragment_mass = shrapnel_kg / fragment_count if fragment_count > 0 else 0
+        
+        # Fragment velocities spread symmetrically around the projectile velocity,
+        # so the average fragment velocity is the projectile velocity itself
+        avg_fragment_velocity = projectile_velocity
+        
+        # Total kinetic energy of all fragments - PURE JOULES
+        # KE = 0.5 * m * v²
+        kinetic_energy_per_fragment = 0.5 * fragment_mass * avg_fragment_velocity * avg_fragment_velocity
+        total_kinetic_energy = kinetic_energy_per_fragment * fragment_count
+        
+        # Shrapnel effective range
+        base_range = 60
+        dispersion_factor = math.sqrt(diameter_mm / 50.0)
+        energy_factor = (total_kinetic_energy / 1000000) ** 0.2
+        max_shrapnel_range = base_range * dispersion_factor * energy_factor
+        
+        return {
+            "diameter_efficiency": diameter_efficiency,
+            "max_damage_radius": max_damage_radius,
+            "available_energy": available_energy,
+            "fragment_count": fragment_count,
+            "fragment_mass": fragment_mass,
+            "kinetic_energy_per_fragment": kinetic_energy_per_fragment,
+            "total_kinetic_energy": total_kinetic_energy,
+            "max_shrapnel_range": max_shrapnel_range
+        }
+    
     @staticmethod
     def create_warhead_data_from_db(bomb_stats):
-        """Convert database format to warhead data for pure joule calculations"""
+        """Convert database format to a Warhead record for pure joule calculations"""
         # Convert km/h to m/s
-        velocity_ms = bomb_stats["velocity_kmh"] * 1000 / 3600
+        velocity_ms = bomb_stats["velocity_kmh"] * DamageCalculator.KMH_TO_MS
         
         # Extract data from database
         total_mass_kg = bomb_stats["mass_kg"]
@@ -271,15 +330,19 @@ class DamageCalculator:
         diameter_mm = bomb_stats.get("diameter_mm", 75)
         length_mm = bomb_stats.get("length_mm", 300)
         
-        return {
-            "explosive_kg": explosive_kg,
-            "shrapnel_percent": shrapnel_percent,
-            "total_mass": total_mass_kg,
-            "velocity": velocity_ms,
-            "diameter_mm": diameter_mm,
-            "length_mm": length_mm,
-            "shrapnel_kg": shrapnel_kg
-        }
+        # Distance-independent terms are baked in so each hit only evaluates falloff
+        return Warhead(
+            explosive_kg=explosive_kg,
+            shrapnel_percent=shrapnel_percent,
+            total_mass=total_mass_kg,
+            velocity=velocity_ms,
+            diameter_mm=diameter_mm,
+            length_mm=length_mm,
+            shrapnel_kg=shrapnel_kg,
+            **DamageCalculator._precompute_warhead_terms(
+                explosive_kg, shrapnel_kg, velocity_ms, diameter_mm, length_mm
+            )
+        )
     
     @staticmethod
     def check_proximity_trigger(projectile_pos, projectile_velocity, targets, fuse_radius=None, delta_time=0):
@@ -292,29 +355,39 @@ class DamageCalculator:
         if fuse_radius is None:
             fuse_radius = DamageCalculator.PROXIMITY_FUSE_RADIUS
         
-        closest_distance = float('inf')
+        px, py = projectile_pos
+        predictive = delta_time > 0
+        if predictive:
+            next_x = px + projectile_velocity[0] * delta_time
+            next_y = py + projectile_velocity[1] * delta_time
+        
+        # Compare squared distances - no sqrt is needed to rank or range-check targets
+        fuse_radius_sq = fuse_radius * fuse_radius
+        closest_dist_sq = float('inf')
         closest_target = None
+        predicted_dist_sq = float('inf')
+        predicted_target = None
         
-        # Current position check
+        # Single pass: current position check plus predictive check to avoid missing fast targets
         for target_pos in targets:
-            distance = DamageCalculator.calculate_distance(projectile_pos, target_pos)
-            if distance <= fuse_radius and distance < closest_distance:
-                closest_distance = distance
-                closest_target = target_pos
-        
-        # Predictive check to avoid missing fast targets
-        if closest_target is None and delta_time > 0:
-            next_x = projectile_pos[0] + projectile_velocity[0] * delta_time
-            next_y = projectile_pos[1] + projectile_velocity[1] * delta_time
-            next_pos = (next_x, next_y)
-            
-            for target_pos in targets:
-                current_dist = DamageCalculator.calculate_distance(projectile_pos, target_pos)
-                next_dist = DamageCalculator.calculate_distance(next_pos, target_pos)
-                
-                if next_dist <= fuse_radius and next_dist < current_dist:
-                    if next_dist < closest_distance:
-                        closest_distance = next_dist
-                        closest_target = target_pos
+            tx, ty = target_pos
+            dx = px - tx
+            dy = py - ty
+            dist_sq = dx * dx + dy * dy
+            if dist_sq <= fuse_radius_sq:
+                if dist_sq < closest_dist_sq:
+                    closest_dist_sq = dist_sq
+                    closest_target = target_pos
+            elif predictive and closest_target is None:
+                dx = next_x - tx
+                dy = next_y - ty
+                next_dist_sq = dx * dx + dy * dy
+                if next_dist_sq <= fuse_radius_sq and next_dist_sq < dist_sq and next_dist_sq < predicted_dist_sq:
+                    predicted_dist_sq = next_dist_sq
+                    predicted_target = target_pos
+        
+        # Predicted hits only count when nothing is in range right now
+        if closest_target is None:
+            closest_target = predicted_target
         
         return (closest_target is not None, closest_target)
\ No newline at end of file
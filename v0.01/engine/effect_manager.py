@@ -1,14 +1,87 @@
 #!/usr/bin/env python3
 import pygame
+import numpy as np
 import math
 import random
+from collections import deque
+from text_cache import TextSurfaceCache
+
+# Faded sprites are cached per alpha bucket rather than per exact alpha
+_ALPHA_BUCKETS = 32
+_ALPHA_BUCKET_SHIFT = 3  # 256 alpha levels / 32 buckets
+
+# Shared generator for batched particle and spark initialisation
+_RNG = np.random.default_rng()
+
+def _bucket_alpha(bucket):
+    """Representative alpha for an alpha bucket (top bucket is fully opaque)"""
+    return (bucket << _ALPHA_BUCKET_SHIFT) | ((1 << _ALPHA_BUCKET_SHIFT) - 1)
+
+def _get_alpha_variant(surface, variants, bucket):
+    """Get a shared faded copy of a surface for an alpha bucket, making it on first use"""
+    faded = variants[bucket]
+    if faded is None:
+        faded = surface.copy()
+        faded.set_alpha(_bucket_alpha(bucket))
+        variants[bucket] = faded
+    return faded
+
+def _update_in_place(effects, delta_time):
+    """Update every effect in a deque, rotating survivors back in order without a new container"""
+    for _ in range(len(effects)):
+        effect = effects.popleft()
+        if effect.update(delta_time):
+            effects.append(effect)
+
+def _integrate_particles(x, y, vx, vy, life, delta_time, gravity=0.0, drag=1.0):
+    """Advance particle arrays in place by one step, reusing one scratch array"""
+    scratch = np.multiply(vx, delta_time)
+    x += scratch
+    np.multiply(vy, delta_time, out=scratch)
+    y += scratch
+    if gravity:
+        g_dt = gravity * delta_time
+        vy += g_dt
+    if drag != 1.0:
+        vx *= drag
+    life -= delta_time
+
 
 class Explosion:
-    """Individual explosion effect"""
+    """Individual explosion effect (plain grey rings for unknown types)"""
+    
+    __slots__ = ("x", "y", "explosion_id", "base_size", "max_duration", "remaining_duration",
+                 "explosion_type", "current_radius", "max_radius", "ring_radius", "ring_max_radius",
+                 "ring_delay", "ring_color", "ring_thickness", "bounds")
+    
+    # Ring colors, indexed by ring number (outer rings reuse the last)
+    RING_COLORS = ((255, 255, 255), (200, 200, 200), (150, 150, 150), (100, 100, 100))
+    
+    # Debris palette, indexed per particle
+    PARTICLE_COLORS = ((255, 255, 100), (255, 150, 50), (255, 100, 100),
+                       (200, 200, 200), (255, 255, 255))
+    
+    # Pre-drawn 6x6 particle sprites keyed by (color index, alpha bucket, radius);
+    # radii of 5 and up already cover the whole sprite
+    PARTICLE_MAX_RADIUS = 5
     
-    def __init__(self, x, y, size=1.0, duration=0.8, explosion_type="standard"):
+    # Debris motion and lifetime; alpha fades with life * PARTICLE_LIFE_DENOM
+    PARTICLE_GRAVITY = 50.0
+    PARTICLE_DRAG = 0.98  # Air resistance, per update
+    PARTICLE_MAX_LIFE = 0.8
+    PARTICLE_LIFE_DENOM = 1.0 / PARTICLE_MAX_LIFE
+    _particle_sprites = {}
+    
+    # Pre-drawn ring surfaces keyed by (radius bucket, color, thickness, alpha bucket);
+    # radii above one quantum snap down to a multiple of it so growing rings reuse surfaces
+    RING_RADIUS_QUANTUM = 4
+    RING_CACHE_LIMIT = 1024
+    _ring_surfaces = {}
+    
+    def __init__(self, x, y, size=1.0, duration=0.8, explosion_type="standard", explosion_id=0):
         self.x = x
         self.y = y
+        self.explosion_id = explosion_id  # Owner id of this explosion's debris in the particle pool
         self.base_size = size
         self.max_duration = duration
         self.remaining_duration = duration
@@ -17,57 +90,52 @@ class Explosion:
         # Visual properties
         self.current_radius = 0
         self.max_radius = int(30 * size)
-        self.rings = []
-        self.particles = []
         
-        # Create explosion rings
+        # Create explosion rings as parallel arrays; all rings share one thickness
         ring_count = max(3, int(4 * size))
-        for i in range(ring_count):
-            ring = {
-                "radius": 0,
-                "max_radius": self.max_radius * (0.7 + i * 0.3),
-                "color": self._get_ring_color(i),
-                "thickness": max(1, int(3 * size)),
-                "delay": i * 0.05  # Stagger ring expansion
-            }
-            self.rings.append(ring)
-        
-        # Create particles for debris effect
-        particle_count = int(15 * size)
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(20, 80) * size
-            particle = {
-                "x": x,
-                "y": y,
-                "vx": math.cos(angle) * speed,
-                "vy": math.sin(angle) * speed,
-                "size": random.uniform(1, 3) * size,
-                "color": self._get_particle_color(),
-                "life": random.uniform(0.3, 0.8)
-            }
-            self.particles.append(particle)
-    
-    def _get_ring_color(self, ring_index):
-        """Get color for explosion ring based on type"""
-        if self.explosion_type == "standard":
-            colors = [(255, 255, 255), (255, 255, 100), (255, 150, 50), (200, 100, 100)]
-        elif self.explosion_type == "energy":
-            colors = [(255, 255, 255), (100, 255, 255), (50, 150, 255), (100, 100, 200)]
-        elif self.explosion_type == "large":
-            colors = [(255, 255, 255), (255, 200, 100), (255, 100, 50), (255, 50, 50)]
-        else:
-            colors = [(255, 255, 255), (200, 200, 200), (150, 150, 150), (100, 100, 100)]
-        
-        return colors[min(ring_index, len(colors) - 1)]
-    
-    def _get_particle_color(self):
-        """Get random particle color"""
-        colors = [
-            (255, 255, 100), (255, 150, 50), (255, 100, 100), 
-            (200, 200, 200), (255, 255, 255)
-        ]
-        return random.choice(colors)
+        ring_index = np.arange(ring_count, dtype=np.float32)
+        self.ring_radius = np.zeros(ring_count, dtype=np.float32)
+        self.ring_max_radius = self.max_radius * (0.7 + ring_index * 0.3)
+        self.ring_delay = ring_index * 0.05  # Stagger ring expansion
+        self.ring_color = np.minimum(np.arange(ring_count), len(self.RING_COLORS) - 1).astype(np.uint8)
+        self.ring_thickness = max(1, int(3 * size))
+        
+        # Screen-space bounds of the largest ring, for culling
+        reach = int(self.ring_max_radius[-1]) + 1
+        self.bounds = pygame.Rect(x - reach, y - reach, 2 * reach, 2 * reach)
+    
+    @classmethod
+    def _get_ring_surface(cls, radius, color, thickness, alpha_bucket):
+        """Get a pre-drawn faded ring of the given integer radius, drawing it on first use"""
+        key = (radius, color, thickness, alpha_bucket)
+        ring_surface = cls._ring_surfaces.get(key)
+        if ring_surface is None:
+            # Circles never leave center +/- radius, so the surface is sized tightly
+            # to keep the blit area (mostly transparent for thin rings) small
+            ring_surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            center = (radius, radius)
+            color = (*color, _bucket_alpha(alpha_bucket))
+            if radius > thickness:
+                pygame.draw.circle(ring_surface, color, center, radius, thickness)
+            else:
+                pygame.draw.circle(ring_surface, color, center, radius)
+            
+            # Large explosions can produce many big surfaces - keep the cache bounded
+            if len(cls._ring_surfaces) >= cls.RING_CACHE_LIMIT:
+                cls._ring_surfaces.clear()
+            cls._ring_surfaces[key] = ring_surface
+        return ring_surface
+    
+    @classmethod
+    def _get_particle_sprite(cls, color_index, alpha_bucket, radius):
+        """Get a pre-drawn particle sprite, drawing it on first use"""
+        key = (color_index, alpha_bucket, radius)
+        sprite = cls._particle_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((6, 6), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*cls.PARTICLE_COLORS[color_index], _bucket_alpha(alpha_bucket)), (3, 3), radius)
+            cls._particle_sprites[key] = sprite
+        return sprite
     
     def update(self, delta_time):
         """Update explosion animation"""
@@ -77,66 +145,88 @@ class Explosion:
         self.remaining_duration -= delta_time
         progress = 1.0 - (self.remaining_duration / self.max_duration)
         
-        # Update rings
-        for ring in self.rings:
-            if progress >= ring["delay"]:
-                ring_progress = min(1.0, (progress - ring["delay"]) / (1.0 - ring["delay"]))
-                ring["radius"] = ring["max_radius"] * ring_progress
-        
-        # Update particles
-        for particle in self.particles[:]:
-            particle["x"] += particle["vx"] * delta_time
-            particle["y"] += particle["vy"] * delta_time
-            particle["vy"] += 50 * delta_time  # Gravity
-            particle["vx"] *= 0.98  # Air resistance
-            particle["life"] -= delta_time
-            
-            if particle["life"] <= 0:
-                self.particles.remove(particle)
+        # Update rings that have started expanding
+        delay = self.ring_delay
+        ring_progress = np.minimum(1.0, (progress - delay) / (1.0 - delay))
+        self.ring_radius = np.where(progress >= delay, self.ring_max_radius * ring_progress, self.ring_radius)
         
         return self.remaining_duration > 0
     
-    def draw(self, screen):
-        """Draw explosion effect"""
+    def collect_blits(self, blits):
+        """Queue explosion ring blits (debris particles are queued from the EffectManager pool)"""
         if self.remaining_duration <= 0:
             return
         
         progress = 1.0 - (self.remaining_duration / self.max_duration)
-        alpha = int(255 * (1.0 - progress) * 0.8)
-        
-        # Draw rings
-        for ring in self.rings:
-            if ring["radius"] > 0:
-                # Create surface with alpha for ring
-                ring_surface = pygame.Surface((ring["radius"] * 2 + 20, ring["radius"] * 2 + 20), pygame.SRCALPHA)
-                ring_color = (*ring["color"], alpha)
-                
-                if ring["radius"] > ring["thickness"]:
-                    pygame.draw.circle(ring_surface, ring_color, 
-                                     (ring["radius"] + 10, ring["radius"] + 10), 
-                                     int(ring["radius"]), ring["thickness"])
-                else:
-                    pygame.draw.circle(ring_surface, ring_color, 
-                                     (ring["radius"] + 10, ring["radius"] + 10), 
-                                     int(ring["radius"]))
-                
-                screen.blit(ring_surface, (self.x - ring["radius"] - 10, self.y - ring["radius"] - 10))
-        
-        # Draw particles
-        for particle in self.particles:
-            if particle["life"] > 0:
-                particle_alpha = int(255 * (particle["life"] / 0.8))
-                particle_color = (*particle["color"], particle_alpha)
-                
-                # Draw particle as small circle
-                particle_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, particle_color, (3, 3), int(particle["size"]))
-                screen.blit(particle_surface, (particle["x"] - 3, particle["y"] - 3))
+        alpha_bucket = int(255 * (1.0 - progress) * 0.8) >> _ALPHA_BUCKET_SHIFT
+        
+        # Rings come from cached surfaces already faded to this alpha bucket
+        quantum = self.RING_RADIUS_QUANTUM
+        palette = self.RING_COLORS
+        thickness = self.ring_thickness
+        for radius, color_index in zip(self.ring_radius.astype(np.int32).tolist(), self.ring_color.tolist()):
+            if radius > 0:
+                if radius >= quantum:
+                    radius -= radius % quantum
+                ring_surface = self._get_ring_surface(radius, palette[color_index], thickness, alpha_bucket)
+                blits.append((ring_surface, (self.x - radius, self.y - radius)))
+
+
+class StandardExplosion(Explosion):
+    """Fiery explosion"""
+    
+    __slots__ = ()
+    
+    RING_COLORS = ((255, 255, 255), (255, 255, 100), (255, 150, 50), (200, 100, 100))
+
+
+class EnergyExplosion(Explosion):
+    """Blue energy burst, also used for charge-up effects"""
+    
+    __slots__ = ()
+    
+    RING_COLORS = ((255, 255, 255), (100, 255, 255), (50, 150, 255), (100, 100, 200))
+
+
+class LargeExplosion(Explosion):
+    """Big red explosion"""
+    
+    __slots__ = ()
+    
+    RING_COLORS = ((255, 255, 255), (255, 200, 100), (255, 100, 50), (255, 50, 50))
+
+
+# Explosion class per explosion type; anything else gets the plain base class
+_EXPLOSION_TYPES = {
+    "standard": StandardExplosion,
+    "energy": EnergyExplosion,
+    "large": LargeExplosion,
+}
 
 
 class MuzzleFlash:
     """Muzzle flash effect for weapon firing"""
     
+    __slots__ = ("x", "y", "angle", "size", "flash_type", "duration", "remaining_duration",
+                 "length", "width", "flash_sprite", "flash_alpha_variants", "flash_rect", "bounds",
+                 "sx", "sy", "svx", "svy", "slife", "scolor")
+    
+    # Spark palette, indexed per spark
+    SPARK_COLORS = ((255, 255, 100), (255, 200, 50), (255, 150, 100), (255, 255, 255))
+    
+    # Pre-drawn 4x4 spark sprites keyed by (color index, alpha bucket)
+    _spark_sprites = {}
+    
+    # Spark lifetime; alpha fades with life * SPARK_LIFE_DENOM
+    SPARK_MAX_LIFE = 0.15
+    SPARK_LIFE_DENOM = 1.0 / SPARK_MAX_LIFE
+    
+    # Pre-rotated opaque flash cones keyed by (length, width), one slot per rotation
+    # bucket, each with lazily built faded copies per alpha bucket
+    FLASH_COLOR = (255, 255, 100)
+    FLASH_ROTATION_BUCKETS = 32
+    _flash_atlas = {}
+    
     def __init__(self, x, y, angle=0, size=1.0, flash_type="standard"):
         self.x = x
         self.y = y
@@ -149,27 +239,57 @@ class MuzzleFlash:
         # Flash properties
         self.length = int(20 * size)
         self.width = int(8 * size)
-        self.sparks = []
         
-        # Create sparks
+        # The cone never changes shape, so pick its pre-rotated sprite once
+        buckets = self.FLASH_ROTATION_BUCKETS
+        rotation_bucket = round(angle * buckets / (2 * math.pi)) % buckets
+        self.flash_sprite, self.flash_alpha_variants = self._get_flash_sprite(self.length, self.width, rotation_bucket)
+        self.flash_rect = self.flash_sprite.get_rect(center=(x, y))
+        
+        # Sparks travel at most 150 * size * 0.15s, well within two cone lengths
+        reach = 2 * self.length + 1
+        self.bounds = pygame.Rect(x - reach, y - reach, 2 * reach, 2 * reach)
+        
+        # Create sparks, stored as parallel arrays like explosion particles
         spark_count = int(5 * size)
-        for _ in range(spark_count):
-            spark_angle = angle + random.uniform(-0.5, 0.5)
-            spark_speed = random.uniform(50, 150) * size
-            spark = {
-                "x": x,
-                "y": y,
-                "vx": math.cos(spark_angle) * spark_speed,
-                "vy": math.sin(spark_angle) * spark_speed,
-                "life": random.uniform(0.05, 0.15),
-                "color": self._get_spark_color()
-            }
-            self.sparks.append(spark)
-    
-    def _get_spark_color(self):
-        """Get random spark color"""
-        colors = [(255, 255, 100), (255, 200, 50), (255, 150, 100), (255, 255, 255)]
-        return random.choice(colors)
+        spark_angles = (angle + _RNG.uniform(-0.5, 0.5, spark_count)).astype(np.float32)
+        spark_speeds = (_RNG.uniform(50, 150, spark_count) * size).astype(np.float32)
+        self.sx = np.full(spark_count, x, dtype=np.float32)
+        self.sy = np.full(spark_count, y, dtype=np.float32)
+        self.svx = np.cos(spark_angles) * spark_speeds
+        self.svy = np.sin(spark_angles) * spark_speeds
+        self.slife = _RNG.uniform(0.05, self.SPARK_MAX_LIFE, spark_count).astype(np.float32)
+        self.scolor = _RNG.integers(0, len(self.SPARK_COLORS), spark_count, dtype=np.uint8)
+    
+    @classmethod
+    def _get_spark_sprite(cls, color_index, alpha_bucket):
+        """Get a pre-drawn spark sprite, drawing it on first use"""
+        key = (color_index, alpha_bucket)
+        sprite = cls._spark_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((4, 4), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*cls.SPARK_COLORS[color_index], _bucket_alpha(alpha_bucket)), (2, 2), 2)
+            cls._spark_sprites[key] = sprite
+        return sprite
+    
+    @classmethod
+    def _get_flash_sprite(cls, length, width, rotation_bucket):
+        """Get the flash cone rotated to a rotation bucket and its alpha variants, drawing it on first use"""
+        rotations = cls._flash_atlas.get((length, width))
+        if rotations is None:
+            rotations = [None] * cls.FLASH_ROTATION_BUCKETS
+            cls._flash_atlas[(length, width)] = rotations
+        
+        entry = rotations[rotation_bucket]
+        if entry is None:
+            # Draw flash as elongated ellipse, then rotate it into place
+            flash_surface = pygame.Surface((length * 2, width * 2), pygame.SRCALPHA)
+            flash_rect = (0, width - width // 2, length, width)
+            pygame.draw.ellipse(flash_surface, cls.FLASH_COLOR, flash_rect)
+            sprite = pygame.transform.rotate(flash_surface, -360.0 * rotation_bucket / cls.FLASH_ROTATION_BUCKETS)
+            entry = (sprite, [None] * _ALPHA_BUCKETS)
+            rotations[rotation_bucket] = entry
+        return entry
     
     def update(self, delta_time):
         """Update muzzle flash"""
@@ -179,51 +299,92 @@ class MuzzleFlash:
         self.remaining_duration -= delta_time
         
         # Update sparks
-        for spark in self.sparks[:]:
-            spark["x"] += spark["vx"] * delta_time
-            spark["y"] += spark["vy"] * delta_time
-            spark["life"] -= delta_time
-            
-            if spark["life"] <= 0:
-                self.sparks.remove(spark)
+        _integrate_particles(self.sx, self.sy, self.svx, self.svy, self.slife, delta_time)
+        
+        # Drop burnt-out sparks with a single mask compaction
+        alive = self.slife > 0
+        if not alive.all():
+            self.sx = self.sx[alive]
+            self.sy = self.sy[alive]
+            self.svx = self.svx[alive]
+            self.svy = self.svy[alive]
+            self.slife = self.slife[alive]
+            self.scolor = self.scolor[alive]
         
         return self.remaining_duration > 0
     
-    def draw(self, screen):
-        """Draw muzzle flash"""
+    def collect_blits(self, blits):
+        """Queue muzzle flash cone and spark blits"""
         if self.remaining_duration <= 0:
             return
         
         progress = 1.0 - (self.remaining_duration / self.duration)
         alpha = int(255 * (1.0 - progress))
         
-        # Main flash cone
-        flash_color = (255, 255, 100, alpha)
-        flash_surface = pygame.Surface((self.length * 2, self.width * 2), pygame.SRCALPHA)
-        
-        # Draw flash as elongated ellipse
-        flash_rect = (0, self.width - self.width // 2, self.length, self.width)
-        pygame.draw.ellipse(flash_surface, flash_color, flash_rect)
-        
-        # Rotate and position flash
-        rotated_flash = pygame.transform.rotate(flash_surface, -math.degrees(self.angle))
-        flash_rect = rotated_flash.get_rect(center=(self.x, self.y))
-        screen.blit(rotated_flash, flash_rect)
-        
-        # Draw sparks
-        for spark in self.sparks:
-            if spark["life"] > 0:
-                spark_alpha = int(255 * (spark["life"] / 0.15))
-                spark_color = (*spark["color"], spark_alpha)
-                
-                spark_surface = pygame.Surface((4, 4), pygame.SRCALPHA)
-                pygame.draw.circle(spark_surface, spark_color, (2, 2), 2)
-                screen.blit(spark_surface, (spark["x"] - 2, spark["y"] - 2))
+        # Main flash cone, using a shared pre-faded copy of the rotated sprite
+        flash_surface = _get_alpha_variant(self.flash_sprite, self.flash_alpha_variants,
+                                           alpha >> _ALPHA_BUCKET_SHIFT)
+        blits.append((flash_surface, self.flash_rect))
+        
+        # Sparks as pre-drawn sprites
+        alpha_scale = 255 * self.SPARK_LIFE_DENOM
+        for sx, sy, life, color_index in zip(self.sx.tolist(), self.sy.tolist(),
+                                             self.slife.tolist(), self.scolor.tolist()):
+            if life > 0:
+                spark_alpha = int(life * alpha_scale)
+                sprite = self._get_spark_sprite(color_index, spark_alpha >> _ALPHA_BUCKET_SHIFT)
+                blits.append((sprite, (sx - 2, sy - 2)))
+
+
+# Fonts are immutable once loaded, so every FloatingText of a size shares one
+_FONT_CACHE = {}
+
+def _get_font(size):
+    """Get the default font at the given size, loading it on first use"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _FONT_CACHE[size] = font
+    return font
+
+
+# Rendered text surfaces keyed by (text, color, font size, critical); damage
+# numbers repeat a lot, and critical ones carry an expensive outline pass.
+# Each entry also holds lazily built faded copies, one per alpha bucket
+_TEXT_CACHE = TextSurfaceCache()
+
+# 3x3 structuring element that grows a glyph mask by one pixel for outlines
+_OUTLINE_KERNEL = pygame.mask.Mask((3, 3), fill=True)
+
+def _get_text_surface(text, color, font_size, is_critical):
+    """Get the rendered (and outlined, if critical) surface for a text and its alpha variants"""
+    key = (text, tuple(color), font_size, is_critical)
+    entry = _TEXT_CACHE.get(key)
+    if entry is not None:
+        return entry
+    
+    font = _get_font(font_size)
+    surface = font.render(text, True, color)
+    
+    if is_critical:
+        # Add outline for critical hits: dilate the glyph mask by one pixel in a
+        # single convolution and paint it black under the text
+        outline_mask = pygame.mask.from_surface(surface).convolve(_OUTLINE_KERNEL)
+        temp_surface = pygame.Surface((surface.get_width() + 4, surface.get_height() + 4), pygame.SRCALPHA)
+        outline_mask.to_surface(temp_surface, setcolor=(0, 0, 0, 255), unsetcolor=None, dest=(1, 1))
+        temp_surface.blit(surface, (2, 2))
+        surface = temp_surface
+    
+    # Bounded LRU, so many distinct numbers never grow it without limit
+    return _TEXT_CACHE.put(key, (surface, [None] * _ALPHA_BUCKETS))
 
 
 class FloatingText:
     """Floating damage/text numbers"""
     
+    __slots__ = ("x", "y", "start_y", "text", "color", "size", "is_critical", "duration",
+                 "remaining_duration", "vx", "vy", "surface", "alpha_variants")
+    
     def __init__(self, x, y, text, color=(255, 255, 255), size=24, is_critical=False):
         self.x = x
         self.y = y
@@ -239,21 +400,9 @@ class FloatingText:
         self.vx = random.uniform(-20, 20)
         self.vy = -30 if is_critical else -20
         
-        # Create text surface
+        # Create text surface (shared between identical texts)
         font_size = int(size * 1.5) if is_critical else size
-        self.font = pygame.font.Font(None, font_size)
-        self.surface = self.font.render(str(text), True, color)
-        
-        if is_critical:
-            # Add outline for critical hits
-            outline_surface = self.font.render(str(text), True, (0, 0, 0))
-            temp_surface = pygame.Surface((self.surface.get_width() + 4, self.surface.get_height() + 4), pygame.SRCALPHA)
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        temp_surface.blit(outline_surface, (dx + 2, dy + 2))
-            temp_surface.blit(self.surface, (2, 2))
-            self.surface = temp_surface
+        self.surface, self.alpha_variants = _get_text_surface(str(text), color, font_size, bool(is_critical))
     
     def update(self, delta_time):
         """Update floating text"""
@@ -272,37 +421,53 @@ class FloatingText:
         
         return self.remaining_duration > 0
     
-    def draw(self, screen):
-        """Draw floating text"""
+    def collect_blits(self, blits):
+        """Queue the floating text blit"""
         if self.remaining_duration <= 0:
             return
         
         progress = 1.0 - (self.remaining_duration / self.duration)
         alpha = int(255 * (1.0 - progress))
         
-        # Fade out text
-        text_surface = self.surface.copy()
-        text_surface.set_alpha(alpha)
-        
-        rect = text_surface.get_rect(center=(self.x, self.y))
-        screen.blit(text_surface, rect)
+        # Fade out text using a shared pre-faded copy for this alpha bucket
+        text_surface = _get_alpha_variant(self.surface, self.alpha_variants, alpha >> _ALPHA_BUCKET_SHIFT)
+        blits.append((text_surface, text_surface.get_rect(center=(self.x, self.y))))
 
 
 class ScreenShake:
     """Screen shake effect for impacts"""
     
-    def __init__(self, duration=0.3, intensity=5.0):
+    __slots__ = ("duration", "remaining_duration", "intensity", "offset")
+    
+    def __init__(self, duration=0.3, intensity=5.0, offset=None):
         self.duration = duration
         self.remaining_duration = duration
         self.intensity = intensity
-        self.offset_x = 0
-        self.offset_y = 0
+        
+        # (x, y) offset slot, usually a row of the EffectManager's shared offset array
+        self.offset = np.zeros(2, dtype=np.float32) if offset is None else offset
+        self.offset[:] = 0
+    
+    @property
+    def offset_x(self):
+        """Current horizontal offset"""
+        return float(self.offset[0])
+    
+    @property
+    def offset_y(self):
+        """Current vertical offset"""
+        return float(self.offset[1])
+    
+    def bind_offset(self, offset):
+        """Move this shake's offset into a new slot, keeping its current value"""
+        if offset is not self.offset:
+            offset[:] = self.offset
+            self.offset = offset
     
     def update(self, delta_time):
         """Update screen shake"""
         if self.remaining_duration <= 0:
-            self.offset_x = 0
-            self.offset_y = 0
+            self.offset[:] = 0
             return False
         
         self.remaining_duration -= delta_time
@@ -312,8 +477,8 @@ class ScreenShake:
         current_intensity = self.intensity * (1.0 - progress)
         
         # Random offset
-        self.offset_x = random.uniform(-current_intensity, current_intensity)
-        self.offset_y = random.uniform(-current_intensity, current_intensity)
+        self.offset[0] = random.uniform(-current_intensity, current_intensity)
+        self.offset[1] = random.uniform(-current_intensity, current_intensity)
         
         return self.remaining_duration > 0
     
@@ -325,12 +490,35 @@ class ScreenShake:
 class EffectManager:
     """Manages all visual effects"""
     
+    # Hard per-category budgets; the oldest effect is dropped when one is exceeded
+    MAX_EXPLOSIONS = 64
+    MAX_MUZZLE_FLASHES = 256
+    MAX_FLOATING_TEXTS = 128
+    MAX_SCREEN_SHAKES = 16
+    
+    # Explosion debris from every explosion lives in one pool of parallel arrays,
+    # grown by doubling; the first entries are live, the tail is spare capacity
+    PARTICLE_POOL_CAPACITY = 256
+    PARTICLE_POOL_FIELDS = (("all_px", np.float32), ("all_py", np.float32),
+                            ("all_pvx", np.float32), ("all_pvy", np.float32),
+                            ("all_psize", np.float32), ("all_plife", np.float32),
+                            ("all_pcolor", np.uint8), ("particle_owner_id", np.int32))
+    
     def __init__(self):
-        # Effect containers
-        self.explosions = []
-        self.muzzle_flashes = []
-        self.floating_texts = []
-        self.screen_shakes = []
+        # Effect containers (bounded, evicting oldest first)
+        self.explosions = deque(maxlen=self.MAX_EXPLOSIONS)
+        self.muzzle_flashes = deque(maxlen=self.MAX_MUZZLE_FLASHES)
+        self.floating_texts = deque(maxlen=self.MAX_FLOATING_TEXTS)
+        self.screen_shakes = deque(maxlen=self.MAX_SCREEN_SHAKES)
+        
+        # Offsets of the active screen shakes, one row per shake in deque order
+        self._shake_xy = np.zeros((self.MAX_SCREEN_SHAKES, 2), dtype=np.float32)
+        
+        # Shared explosion particle pool
+        self.particle_count = 0
+        self.next_explosion_id = 0
+        for name, dtype in self.PARTICLE_POOL_FIELDS:
+            setattr(self, name, np.empty(self.PARTICLE_POOL_CAPACITY, dtype=dtype))
         
         # Effect counters for performance monitoring
         self.effect_counts = {
@@ -344,11 +532,107 @@ class EffectManager:
     
     def add_explosion(self, x, y, size=1.0, duration=0.8, explosion_type="standard"):
         """Add explosion effect"""
-        explosion = Explosion(x, y, size, duration, explosion_type)
+        explosion_id = self.next_explosion_id
+        self.next_explosion_id = (explosion_id + 1) & 0x7FFFFFFF
+        explosion_class = _EXPLOSION_TYPES.get(explosion_type, Explosion)
+        explosion = explosion_class(x, y, size, duration, explosion_type, explosion_id)
+        if len(self.explosions) >= self.MAX_EXPLOSIONS:
+            # The deque evicts the oldest explosion; its debris goes with it
+            self._retire_particles(self.explosions[0].explosion_id)
         self.explosions.append(explosion)
+        self._spawn_explosion_particles(x, y, size, explosion_id)
         self.effect_counts["explosions"] += 1
         return explosion
     
+    def _reserve_particles(self, count):
+        """Make room for count more particles in the pool, doubling its capacity as needed"""
+        needed = self.particle_count + count
+        capacity = len(self.all_px)
+        if needed <= capacity:
+            return
+        
+        while capacity < needed:
+            capacity *= 2
+        live = self.particle_count
+        for name, dtype in self.PARTICLE_POOL_FIELDS:
+            grown = np.empty(capacity, dtype=dtype)
+            grown[:live] = getattr(self, name)[:live]
+            setattr(self, name, grown)
+    
+    def _spawn_explosion_particles(self, x, y, size, explosion_id):
+        """Write an explosion's debris particles into the tail of the pool"""
+        count = int(15 * size)
+        if count <= 0:
+            return
+        
+        self._reserve_particles(count)
+        start = self.particle_count
+        end = start + count
+        angles = _RNG.uniform(0, 2 * np.pi, count).astype(np.float32)
+        speeds = (_RNG.uniform(20, 80, count) * size).astype(np.float32)
+        self.all_px[start:end] = x
+        self.all_py[start:end] = y
+        np.multiply(np.cos(angles), speeds, out=self.all_pvx[start:end])
+        np.multiply(np.sin(angles), speeds, out=self.all_pvy[start:end])
+        self.all_psize[start:end] = _RNG.uniform(1, 3, count) * size
+        self.all_plife[start:end] = _RNG.uniform(0.3, Explosion.PARTICLE_MAX_LIFE, count)
+        self.all_pcolor[start:end] = _RNG.integers(0, len(Explosion.PARTICLE_COLORS), count, dtype=np.uint8)
+        self.particle_owner_id[start:end] = explosion_id
+        self.particle_count = end
+    
+    def _retire_particles(self, explosion_id):
+        """Kill an explosion's debris early; it is compacted out on the next update"""
+        count = self.particle_count
+        self.all_plife[:count][self.particle_owner_id[:count] == explosion_id] = 0
+    
+    def _update_particles(self, delta_time, expired_ids):
+        """Integrate the whole particle pool, then compact out dead and orphaned particles"""
+        count = self.particle_count
+        if count == 0:
+            return
+        
+        # One kernel call for every explosion's debris, with gravity and air resistance
+        _integrate_particles(self.all_px[:count], self.all_py[:count], self.all_pvx[:count],
+                             self.all_pvy[:count], self.all_plife[:count],
+                             delta_time, gravity=Explosion.PARTICLE_GRAVITY, drag=Explosion.PARTICLE_DRAG)
+        
+        # Debris never outlives the explosion that spawned it
+        alive = self.all_plife[:count] > 0
+        if expired_ids:
+            alive &= ~np.isin(self.particle_owner_id[:count], expired_ids)
+        
+        if not alive.all():
+            live = int(np.count_nonzero(alive))
+            for name, _ in self.PARTICLE_POOL_FIELDS:
+                field = getattr(self, name)
+                field[:live] = field[:count][alive]
+            self.particle_count = live
+    
+    def _collect_particle_blits(self):
+        """Group pooled debris particles as pre-drawn circle sprite blits, keyed by owning explosion id"""
+        grouped = {}
+        count = self.particle_count
+        if count == 0:
+            return grouped
+        
+        max_radius = Explosion.PARTICLE_MAX_RADIUS
+        get_sprite = Explosion._get_particle_sprite
+        alpha_scale = 255 * Explosion.PARTICLE_LIFE_DENOM
+        for px, py, size, life, color_index, owner_id in zip(self.all_px[:count].tolist(), self.all_py[:count].tolist(),
+                                                             self.all_psize[:count].tolist(), self.all_plife[:count].tolist(),
+                                                             self.all_pcolor[:count].tolist(),
+                                                             self.particle_owner_id[:count].tolist()):
+            particle_alpha = int(life * alpha_scale)
+            radius = min(int(size), max_radius)
+            sprite = get_sprite(color_index, particle_alpha >> _ALPHA_BUCKET_SHIFT, radius)
+            blit = (sprite, (px - 3, py - 3))
+            group = grouped.get(owner_id)
+            if group is None:
+                grouped[owner_id] = [blit]
+            else:
+                group.append(blit)
+        return grouped
+    
     def add_muzzle_flash(self, x, y, angle=0, size=1.0, flash_type="standard"):
         """Add muzzle flash effect"""
         flash = MuzzleFlash(x, y, angle, size, flash_type)
@@ -370,9 +654,15 @@ class EffectManager:
         """Add screen shake effect"""
         shake = ScreenShake(duration, intensity)
         self.screen_shakes.append(shake)
+        self._bind_shake_slots()
         self.effect_counts["screen_shakes"] += 1
         return shake
     
+    def _bind_shake_slots(self):
+        """Point each active shake at the offset row matching its deque position"""
+        for slot, shake in enumerate(self.screen_shakes):
+            shake.bind_offset(self._shake_xy[slot])
+    
     def add_impact_spark(self, x, y, angle=0):
         """Add impact sparks for projectile hits"""
         return self.add_muzzle_flash(x, y, angle + math.pi, 0.5, "impact")
@@ -383,29 +673,38 @@ class EffectManager:
     
     def update(self, delta_time):
         """Update all effects"""
-        # Update explosions
-        self.explosions = [exp for exp in self.explosions if exp.update(delta_time)]
+        # Update explosions, remembering which ones ended so their debris goes too
+        explosions = self.explosions
+        expired_ids = []
+        for _ in range(len(explosions)):
+            explosion = explosions.popleft()
+            if explosion.update(delta_time):
+                explosions.append(explosion)
+            else:
+                expired_ids.append(explosion.explosion_id)
+        
+        # Update all explosion debris in one pass
+        self._update_particles(delta_time, expired_ids)
         
         # Update muzzle flashes
-        self.muzzle_flashes = [flash for flash in self.muzzle_flashes if flash.update(delta_time)]
+        _update_in_place(self.muzzle_flashes, delta_time)
         
         # Update floating texts
-        self.floating_texts = [text for text in self.floating_texts if text.update(delta_time)]
+        _update_in_place(self.floating_texts, delta_time)
         
-        # Update screen shakes
-        self.screen_shakes = [shake for shake in self.screen_shakes if shake.update(delta_time)]
+        # Update screen shakes, compacting their offset rows if any ended
+        shake_count = len(self.screen_shakes)
+        _update_in_place(self.screen_shakes, delta_time)
+        if len(self.screen_shakes) != shake_count:
+            self._bind_shake_slots()
     
     def draw(self, screen):
         """Draw all effects"""
         # Apply screen shake if active
         shake_offset = (0, 0)
         if self.screen_shakes:
-            # Combine all active screen shakes
-            total_x, total_y = 0, 0
-            for shake in self.screen_shakes:
-                offset_x, offset_y = shake.get_offset()
-                total_x += offset_x
-                total_y += offset_y
+            # Combine all active screen shakes with one reduction over their offset rows
+            total_x, total_y = self._shake_xy[:len(self.screen_shakes)].sum(axis=0).tolist()
             shake_offset = (total_x, total_y)
         
         # Create temporary surface for shake effect
@@ -414,17 +713,37 @@ class EffectManager:
             # and just draw effects with offset positions
             pass
         
-        # Draw explosions (back to front)
+        # Effects entirely outside the screen are skipped
+        screen_rect = screen.get_rect()
+        
+        # Every effect queues its blits in z-order, then they go out in one blits call
+        blits = []
+        
+        # Explosions (back to front), each followed by its own pooled debris so overlaps layer per explosion
+        particle_blits = self._collect_particle_blits()
         for explosion in self.explosions:
-            explosion.draw(screen)
+            if screen_rect.colliderect(explosion.bounds):
+                explosion.collect_blits(blits)
+            debris = particle_blits.pop(explosion.explosion_id, None)
+            if debris:
+                blits.extend(debris)
         
-        # Draw muzzle flashes
+        # Debris of explosions retired since the last update (already faded out)
+        for debris in particle_blits.values():
+            blits.extend(debris)
+        
+        # Muzzle flashes
         for flash in self.muzzle_flashes:
-            flash.draw(screen)
+            if screen_rect.colliderect(flash.bounds):
+                flash.collect_blits(blits)
         
-        # Draw floating texts (on top)
+        # Floating texts (on top)
         for text in self.floating_texts:
-            text.draw(screen)
+            if screen_rect.colliderect(text.surface.get_rect(center=(text.x, text.y))):
+                text.collect_blits(blits)
+        
+        if blits:
+            screen.blits(blits, doreturn=False)
     
     def clear_all_effects(self):
         """Clear all effects (for scene transitions)"""
@@ -432,6 +751,7 @@ class EffectManager:
         self.muzzle_flashes.clear()
         self.floating_texts.clear()
         self.screen_shakes.clear()
+        self.particle_count = 0
         
         # Reset counters
         for key in self.effect_counts:
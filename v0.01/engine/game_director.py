@@ -2,9 +2,23 @@
 import pygame
 import sys
 from enum import Enum
+import functools
+import logging
 import math
 import random
 
+log = logging.getLogger(__name__)
+
+# Key names never change, so look each one up only once
+_key_name = functools.lru_cache(maxsize=512)(pygame.key.name)
+
+# The only event types the game loop reacts to
+_HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+
+# One period of the level-up pulse |sin(ticks * 0.01)|, indexed by int(ticks * _PULSE_LUT_SCALE) & 255
+_PULSE_LUT = tuple(abs(math.sin(math.pi * i / 256)) for i in range(256))
+_PULSE_LUT_SCALE = 0.01 * 256 / math.pi
+
 # Complete RPG System Integration
 class RPGBombSystem:
     def __init__(self):
@@ -12,6 +26,15 @@ class RPGBombSystem:
         self.ENERGY_PER_KG = 4184000
         self.base_cooldown = 4.0
         self.breach_bomb_multiplier = 5
+        
+        # Breach_Bomb fan pattern as unit direction vectors, fixed for every burst,
+        # and the matching launch velocities at the fixed 800 km/h launch speed
+        angles = [-math.pi/2 - math.pi/12, -math.pi/2 - math.pi/24, -math.pi/2,
+                  -math.pi/2 + math.pi/24, -math.pi/2 + math.pi/12]
+        self.fan_dirs = tuple((math.cos(a), math.sin(a)) for a in angles)
+        self.breach_bomb_velocity_ms = 800 * DamageCalculator.KMH_TO_MS
+        self.fan_velocities = tuple((cx * self.breach_bomb_velocity_ms, sy * self.breach_bomb_velocity_ms)
+                                    for cx, sy in self.fan_dirs)
     
     def get_bomb_energy(self, level):
         explosive_kg = self.base_explosive_kg.get(level, 0.5)
@@ -27,20 +50,38 @@ class RPGBombSystem:
         }
 
 class InventorySystem:
+    __slots__ = ('_counts', 'visible')
+    
+    # Resource counters live in one list, indexed by resource name
+    _names = ('kerr_scrap', 'rare_metals', 'energy_cores')
+    _idx = {name: i for i, name in enumerate(_names)}
+    
     def __init__(self):
-        self.kerr_scrap = 0
-        self.rare_metals = 0
-        self.energy_cores = 0
+        self._counts = [0] * len(self._names)
         self.visible = False
         print("Inventory system initialized")
     
+    @property
+    def kerr_scrap(self):
+        return self._counts[0]
+    
+    @property
+    def rare_metals(self):
+        return self._counts[1]
+    
+    @property
+    def energy_cores(self):
+        return self._counts[2]
+    
     def add_item(self, item_type, amount=1):
-        if hasattr(self, item_type):
-            current = getattr(self, item_type)
-            setattr(self, item_type, current + amount)
-            print(f"Added {amount} {item_type}, total: {current + amount}")
-            return True
-        return False
+        i = self._idx.get(item_type)
+        if i is None:
+            return False
+        
+        self._counts[i] += amount
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Added %d %s, total: %d", amount, item_type, self._counts[i])
+        return True
     
     def toggle_visibility(self):
         self.visible = not self.visible
@@ -68,6 +109,7 @@ class ProgressionIntegrator:
         self.experience = 0
         self.stat_points = 0
         self.attack = 1
+        self.bomb_level = 1  # min(13, attack), kept in step by allocate_stat_point
         self.defense = 1
         self.evasion = 1
         self.shield = 1
@@ -76,51 +118,57 @@ class ProgressionIntegrator:
         self.level_up_timer = 0
         self.show_stat_allocation = False
         
+        # Stat allocation keys 1-4, dispatched by lookup
+        self._stat_names = ("attack", "defense", "evasion", "shield")
+        self._stat_keys = dict(zip((pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4), self._stat_names))
+        
+        # Breach bomb stats depend only on bomb level; bomb ids just need to be unique
+        self._bomb_stats_cache = {}
+        self._bomb_id = 0
+        
+        # UI data is rebuilt only after something it shows has changed
+        self._ui_dirty = True
+        self._ui_cache = None
+        
         print("ProgressionIntegrator initialized")
     
     def get_bomb_level(self):
-        return min(13, self.attack)
+        return self.bomb_level
     
     def handle_input(self, key):
-        print(f"ProgressionIntegrator.handle_input called with key: {pygame.key.name(key)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("ProgressionIntegrator.handle_input called with key: %s", _key_name(key))
         
         if key == pygame.K_i:
-            print("Handling inventory key in progression system")
             result = self.inventory.toggle_visibility()
-            print(f"Inventory toggle returned: {result}")
+            self._ui_dirty = True
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Inventory toggle returned: %s", result)
             return True
         
         if key == pygame.K_c and self.stat_points > 0:
             self.show_stat_allocation = not self.show_stat_allocation
+            self._ui_dirty = True
             return True
         
         if self.show_stat_allocation:
-            if key == pygame.K_1:
-                return self.allocate_stat_point("attack")
-            elif key == pygame.K_2:
-                return self.allocate_stat_point("defense")
-            elif key == pygame.K_3:
-                return self.allocate_stat_point("evasion")
-            elif key == pygame.K_4:
-                return self.allocate_stat_point("shield")
+            stat_name = self._stat_keys.get(key)
+            if stat_name:
+                return self.allocate_stat_point(stat_name)
         
         return False
     
     def allocate_stat_point(self, stat_name):
-        if self.stat_points <= 0:
+        if self.stat_points <= 0 or stat_name not in self._stat_names:
             return False
         
+        setattr(self, stat_name, getattr(self, stat_name) + 1)
         if stat_name == "attack":
-            self.attack += 1
-        elif stat_name == "defense":
-            self.defense += 1
-        elif stat_name == "evasion":
-            self.evasion += 1
-        elif stat_name == "shield":
-            self.shield += 1
-        
+            self.bomb_level = self.attack if self.attack < 13 else 13
         self.stat_points -= 1
-        print(f"Allocated point to {stat_name}. Remaining: {self.stat_points}")
+        self._ui_dirty = True
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Allocated point to %s. Remaining: %d", stat_name, self.stat_points)
         return True
     
     def on_enemy_killed(self, enemy_type, enemy_level):
@@ -137,9 +185,11 @@ class ProgressionIntegrator:
             leveled_up = True
             self.show_level_up = True
             self.level_up_timer = 3.0
-            print(f"LEVEL UP! Now level {self.player_level}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("LEVEL UP! Now level %d", self.player_level)
         
         drops = self.drop_system.award_drops(enemy_type, enemy_level)
+        self._ui_dirty = True
         
         return {
             'exp_gained': exp_gained,
@@ -148,13 +198,12 @@ class ProgressionIntegrator:
         }
     
     def fire_breach_bomb(self, projectile_manager, ship_pos):
-        bomb_level = self.get_bomb_level()
-        bomb_data = self.rpg_bombs.calculate_bomb_damage(bomb_level, use_breach_bomb=True)
-        
-        angles = [-math.pi/2 - math.pi/12, -math.pi/2 - math.pi/24, -math.pi/2, 
-                  -math.pi/2 + math.pi/24, -math.pi/2 + math.pi/12]
+        bomb_level = self.bomb_level
         
-        for angle in angles:
+        # Every bomb in the burst shares one (read-only) stats dict per level
+        bomb_stats = self._bomb_stats_cache.get(bomb_level)
+        if bomb_stats is None:
+            bomb_data = self.rpg_bombs.calculate_bomb_damage(bomb_level, use_breach_bomb=True)
             explosive_kg = bomb_data['energy_per_bomb'] / self.rpg_bombs.ENERGY_PER_KG
             
             bomb_stats = {
@@ -166,16 +215,17 @@ class ProgressionIntegrator:
                 "length_mm": 300 + bomb_level * 20,
                 "shrapnel_kg": explosive_kg * 2
             }
-            
-            velocity_ms = 800 * 1000 / 3600
-            vx = math.cos(angle) * velocity_ms
-            vy = math.sin(angle) * velocity_ms
-            
+            self._bomb_stats_cache[bomb_level] = bomb_stats
+        
+        launch_x = ship_pos[0]
+        launch_y = ship_pos[1] - 25
+        for vx, vy in self.rpg_bombs.fan_velocities:
+            self._bomb_id += 1
             projectile_manager.add_bomb(
-                ship_pos[0], ship_pos[1] - 25,
+                launch_x, launch_y,
                 vx, vy,
                 bomb_stats,
-                f"breach_bomb_{random.randint(1000, 9999)}"
+                f"breach_bomb_{self._bomb_id}"
             )
         
         return self.rpg_bombs.base_cooldown
@@ -187,9 +237,15 @@ class ProgressionIntegrator:
                 self.show_level_up = False
                 if self.stat_points > 0:
                     self.show_stat_allocation = True
+                self._ui_dirty = True
     
     def get_ui_data(self):
-        return {
+        # The returned dicts are shared between frames - callers must not modify them
+        if not self._ui_dirty:
+            return self._ui_cache
+        
+        self._ui_dirty = False
+        self._ui_cache = {
             'player': {
                 'level': self.player_level,
                 'experience': self.experience,
@@ -199,7 +255,7 @@ class ProgressionIntegrator:
                 'defense': self.defense,
                 'evasion': self.evasion,
                 'shield': self.shield,
-                'bomb_level': self.get_bomb_level(),
+                'bomb_level': self.bomb_level,
                 'show_level_up': self.show_level_up,
                 'show_stat_allocation': self.show_stat_allocation
             },
@@ -212,6 +268,7 @@ class ProgressionIntegrator:
                 }
             }
         }
+        return self._ui_cache
 
 class InventoryUI:
     def __init__(self, screen_width, screen_height):
@@ -220,15 +277,50 @@ class InventoryUI:
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
+        
+        # Full-screen dimming layer behind the inventory, allocated once
+        self._dim_overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self._dim_overlay.fill((0, 0, 0, 180))
+        
+        # Rendered text keyed by (font, text, color); most UI lines never change
+        self._text_cache = TextSurfaceCache()
+        self._render = self._text_cache.render
+        
+        # Stat allocation rows: fixed key/name labels, plus formatted lines keyed by the stat values
+        self._stat_labels = (("1", "ATTACK"), ("2", "DEFENSE"), ("3", "EVASION"), ("4", "SHIELD"))
+        self._stat_lines = {}
+        
+        # Static panel chrome (background, border and any fixed title), drawn once
+        self._inv_panel_bg = self._build_panel(800, 600, (40, 40, 80), (100, 100, 200), 3)
+        title = self._render(self.font_large, "INVENTORY & STATS", (255, 255, 100))
+        self._inv_panel_bg.blit(title, title.get_rect(center=(400, 40)))
+        
+        # Fixed inventory lines, by row of the 30px line grid starting 100px down
+        static_lines = (
+            (4, "RESOURCES:", (100, 255, 100)),
+            (9, "CONTROLS:", (100, 255, 100)),
+            (10, "I - Close Inventory", (255, 255, 255)),
+            (11, "C - Stat Allocation (if points available)", (255, 255, 255)),
+            (12, "1-4 - Allocate stat points (Attack/Defense/Evasion/Shield)", (255, 255, 255))
+        )
+        for row, line, color in static_lines:
+            self._inv_panel_bg.blit(self.font_small.render(line, True, color), (30, 100 + row * 30))
+        self._stat_panel_bg = self._build_panel(600, 400, (40, 40, 80), (255, 255, 100), 3)
+        self._level_up_panel_bg = self._build_panel(500, 150, (255, 255, 0), (255, 255, 255), 4)
+    
+    def _build_panel(self, width, height, fill_color, border_color, border_width):
+        # Border colour everywhere, then the interior: two memfills instead of a fill plus an edge walk
+        panel = pygame.Surface((width, height))
+        panel.fill(border_color)
+        panel.fill(fill_color, (border_width, border_width, width - 2 * border_width, height - 2 * border_width))
+        return panel
     
     def draw_inventory(self, screen, inventory_data, player_data):
         if not inventory_data['visible']:
             return
         
         # Semi-transparent background
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._dim_overlay, (0, 0))
         
         # Main panel
         panel_width = 800
@@ -236,43 +328,32 @@ class InventoryUI:
         panel_x = (self.screen_width - panel_width) // 2
         panel_y = (self.screen_height - panel_height) // 2
         
-        pygame.draw.rect(screen, (40, 40, 80), (panel_x, panel_y, panel_width, panel_height))
-        pygame.draw.rect(screen, (100, 100, 200), (panel_x, panel_y, panel_width, panel_height), 3)
-        
-        # Title
-        title = self.font_large.render("INVENTORY & STATS", True, (255, 255, 100))
-        title_rect = title.get_rect(center=(panel_x + panel_width//2, panel_y + 40))
-        screen.blit(title, title_rect)
-        
-        # Player info
-        y_offset = panel_y + 100
-        info_lines = [
-            f"Level: {player_data['level']} (Bomb Level: {player_data['bomb_level']})",
-            f"Attack: {player_data['attack']} | Defense: {player_data['defense']} | Evasion: {player_data['evasion']} | Shield: {player_data['shield']}",
-            f"Stat Points Available: {player_data['stat_points']}",
-            "",
-            "RESOURCES:",
-            f"Kerr Scrap: {inventory_data['resources']['kerr_scrap']}",
-            f"Rare Metals: {inventory_data['resources']['rare_metals']}",
-            f"Energy Cores: {inventory_data['resources']['energy_cores']}",
-            "",
-            "CONTROLS:",
-            "I - Close Inventory",
-            "C - Stat Allocation (if points available)",
-            "1-4 - Allocate stat points (Attack/Defense/Evasion/Shield)"
-        ]
-        
-        for line in info_lines:
-            if line:
-                color = (255, 255, 100) if "Stat Points" in line and player_data['stat_points'] > 0 else (255, 255, 255)
-                if line == "RESOURCES:" or line == "CONTROLS:":
-                    color = (100, 255, 100)
-                
-                text = self.font_small.render(line, True, color)
-                screen.blit(text, (panel_x + 30, y_offset))
-            y_offset += 30
-    
-    def draw_level_up_notification(self, screen, player_data):
+        # Panel with its title
+        screen.blit(self._inv_panel_bg, (panel_x, panel_y))
+        
+        # Player info and resource counts; headers and help text are baked into the panel
+        text_x = panel_x + 30
+        line_y = panel_y + 100
+        white = (255, 255, 255)
+        p = player_data
+        atk, dfn, ev, sh, sp, bl = p['attack'], p['defense'], p['evasion'], p['shield'], p['stat_points'], p['bomb_level']
+        stat_points_color = (255, 255, 100) if sp > 0 else white
+        resources = inventory_data['resources']
+        
+        screen.blit(self._render(self.font_small, f"Level: {p['level']} (Bomb Level: {bl})", white),
+                    (text_x, line_y))
+        screen.blit(self._render(self.font_small, f"Attack: {atk} | Defense: {dfn} | Evasion: {ev} | Shield: {sh}", white),
+                    (text_x, line_y + 30))
+        screen.blit(self._render(self.font_small, f"Stat Points Available: {sp}", stat_points_color),
+                    (text_x, line_y + 60))
+        screen.blit(self._render(self.font_small, f"Kerr Scrap: {resources['kerr_scrap']}", white),
+                    (text_x, line_y + 150))
+        screen.blit(self._render(self.font_small, f"Rare Metals: {resources['rare_metals']}", white),
+                    (text_x, line_y + 180))
+        screen.blit(self._render(self.font_small, f"Energy Cores: {resources['energy_cores']}", white),
+                    (text_x, line_y + 210))
+    
+    def draw_level_up_notification(self, screen, player_data, ticks=None):
         if not player_data.get('show_level_up', False):
             return
         
@@ -281,20 +362,23 @@ class InventoryUI:
         panel_x = (self.screen_width - panel_width) // 2
         panel_y = (self.screen_height - panel_height) // 2
         
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.01))
+        if ticks is None:
+            ticks = pygame.time.get_ticks()
+        pulse = _PULSE_LUT[int(ticks * _PULSE_LUT_SCALE) & 255]
         alpha = int(200 + 50 * pulse)
         
-        pygame.draw.rect(screen, (255, 255, 0, alpha), (panel_x, panel_y, panel_width, panel_height))
-        pygame.draw.rect(screen, (255, 255, 255), (panel_x, panel_y, panel_width, panel_height), 4)
+        self._level_up_panel_bg.set_alpha(alpha)
+        screen.blit(self._level_up_panel_bg, (panel_x, panel_y))
         
+        stat_points = player_data['stat_points']
         level_text = f"LEVEL UP! Now Level {player_data['level']}"
-        level_surface = self.font_large.render(level_text, True, (0, 0, 0))
+        level_surface = self._render(self.font_large, level_text, (0, 0, 0))
         level_rect = level_surface.get_rect(center=(panel_x + panel_width//2, panel_y + 60))
         screen.blit(level_surface, level_rect)
         
-        if player_data['stat_points'] > 0:
-            points_text = f"You have {player_data['stat_points']} stat points! Press C"
-            points_surface = self.font_medium.render(points_text, True, (0, 0, 0))
+        if stat_points > 0:
+            points_text = f"You have {stat_points} stat points! Press C"
+            points_surface = self._render(self.font_medium, points_text, (0, 0, 0))
             points_rect = points_surface.get_rect(center=(panel_x + panel_width//2, panel_y + 100))
             screen.blit(points_surface, points_rect)
     
@@ -307,44 +391,55 @@ class InventoryUI:
         panel_x = (self.screen_width - panel_width) // 2
         panel_y = (self.screen_height - panel_height) // 2
         
-        pygame.draw.rect(screen, (40, 40, 80, 220), (panel_x, panel_y, panel_width, panel_height))
-        pygame.draw.rect(screen, (255, 255, 100), (panel_x, panel_y, panel_width, panel_height), 3)
+        screen.blit(self._stat_panel_bg, (panel_x, panel_y))
         
-        title = f"ALLOCATE STAT POINTS ({player_data['stat_points']} available)"
-        title_surface = self.font_large.render(title, True, (255, 255, 100))
+        p = player_data
+        atk, dfn, ev, sh, sp, bl = p['attack'], p['defense'], p['evasion'], p['shield'], p['stat_points'], p['bomb_level']
+        
+        title = f"ALLOCATE STAT POINTS ({sp} available)"
+        title_surface = self._render(self.font_large, title, (255, 255, 100))
         title_rect = title_surface.get_rect(center=(panel_x + panel_width//2, panel_y + 40))
         screen.blit(title_surface, title_rect)
         
         y_offset = panel_y + 100
-        stats = [
-            ("1", "ATTACK", player_data['attack'], f"Bomb Level: {player_data['bomb_level']} → {min(13, player_data['attack'] + 1)}"),
-            ("2", "DEFENSE", player_data['defense'], f"Damage Resist: {(player_data['defense']-1)*5:.0f}% → {player_data['defense']*5:.0f}%"),
-            ("3", "EVASION", player_data['evasion'], f"Dodge: {(player_data['evasion']-1)*3:.0f}% → {player_data['evasion']*3:.0f}%"),
-            ("4", "SHIELD", player_data['shield'], f"Capacity: +{(player_data['shield']-1)*500:.0f}J → +{player_data['shield']*500:.0f}J")
-        ]
-        
-        for key, name, current, effect in stats:
-            key_text = f"[{key}] {name}: {current}"
-            key_surface = self.font_medium.render(key_text, True, (255, 255, 255))
+        stat_key = (atk, dfn, ev, sh, bl)
+        lines = self._stat_lines.get(stat_key)
+        if lines is None:
+            effects = (
+                f"Bomb Level: {bl} → {min(13, atk + 1)}",
+                f"Damage Resist: {(dfn-1)*5:.0f}% → {dfn*5:.0f}%",
+                f"Dodge: {(ev-1)*3:.0f}% → {ev*3:.0f}%",
+                f"Capacity: +{(sh-1)*500:.0f}J → +{sh*500:.0f}J"
+            )
+            lines = tuple((f"[{key}] {name}: {current}", effect)
+                          for (key, name), current, effect in zip(self._stat_labels, stat_key, effects))
+            if len(self._stat_lines) >= 64:
+                self._stat_lines.clear()
+            self._stat_lines[stat_key] = lines
+        
+        for key_text, effect in lines:
+            key_surface = self._render(self.font_medium, key_text, (255, 255, 255))
             screen.blit(key_surface, (panel_x + 50, y_offset))
             
-            effect_surface = self.font_small.render(effect, True, (200, 200, 200))
+            effect_surface = self._render(self.font_small, effect, (200, 200, 200))
             screen.blit(effect_surface, (panel_x + 70, y_offset + 25))
             
             y_offset += 60
         
         control_text = "Press 1-4 to allocate points | C to close"
-        control_surface = self.font_small.render(control_text, True, (200, 200, 200))
+        control_surface = self._render(self.font_small, control_text, (200, 200, 200))
         screen.blit(control_surface, (panel_x + 50, panel_y + panel_height - 40))
 
 # Import existing systems
 from weapons_database import WeaponsDatabase
+from damage_calculator import DamageCalculator
 from breacher_ship import BreacherShip
 from effect_manager import EffectManager
 from universal_cannon import add_universal_cannon_to_ship, CannonManager
 from projectile_manager import ProjectileManager
 from enemy_manager import EnemyManager
 from hud_renderer import HUDRenderer
+from text_cache import TextSurfaceCache
 
 class GameState(Enum):
     MAIN_MENU = "main_menu"
@@ -364,7 +459,8 @@ class InputManager:
         self.projectile_manager = projectile_manager
         self.effect_manager = effect_manager
         self.progression_manager = progression_manager
-        print(f"InputManager.set_managers called - progression_manager: {progression_manager is not None}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("InputManager.set_managers called - progression_manager: %s", progression_manager is not None)
     
     def handle_event(self, event, player_ship):
         if event.type == pygame.KEYDOWN:
@@ -376,16 +472,17 @@ class InputManager:
         key = event.key
         self.keys_held.add(key)
         
-        print(f"Key pressed: {pygame.key.name(key)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Key pressed: %s", _key_name(key))
         
         # CRITICAL: Progression system first
         if self.progression_manager:
-            print("Calling progression_manager.handle_input")
             if self.progression_manager.handle_input(key):
-                print("Progression system handled the key")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Progression system handled the key")
                 return
         else:
-            print("ERROR: No progression_manager in InputManager!")
+            log.error("No progression_manager in InputManager!")
         
         # Weapon handling
         if key == pygame.K_LCTRL:
@@ -405,11 +502,12 @@ class InputManager:
     
     def _fire_breach_bomb_rpg(self, player_ship):
         if not self.projectile_manager or not self.progression_manager:
-            print("Missing managers for RPG breach bomb")
+            log.warning("Missing managers for RPG breach bomb")
             return
         
         if "breach_bomb" in player_ship.cooldowns:
-            print(f"Breach bomb on cooldown: {player_ship.cooldowns['breach_bomb']:.1f}s")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Breach bomb on cooldown: %.1fs", player_ship.cooldowns['breach_bomb'])
             return
         
         try:
@@ -424,11 +522,11 @@ class InputManager:
                 self.effect_manager.add_muzzle_flash(player_ship.x, player_ship.y - 25, size=2.0)
                 self.effect_manager.add_screen_shake(0.3, 8.0)
             
-            bomb_level = self.progression_manager.get_bomb_level()
-            print(f"Fired RPG Breach_Bomb: Level {bomb_level}, 5 bombs")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Fired RPG Breach_Bomb: Level %d, 5 bombs", self.progression_manager.bomb_level)
             
         except Exception as e:
-            print(f"Error firing RPG breach bomb: {e}")
+            log.error("Error firing RPG breach bomb: %s", e)
     
     def _fire_special_weapon(self, player_ship, ability_name):
         if self.projectile_manager and ability_name in player_ship.get_special_abilities():
@@ -458,6 +556,14 @@ class GameDirector:
         self.screen = pygame.display.set_mode((3840, 2160), pygame.FULLSCREEN)
         pygame.display.set_caption("MarsDefense - RPG Working")
         
+        # Only quit and keyboard events are consumed; keep mouse/window traffic off the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
+        
+        # Full-screen pause dimming layer, allocated once
+        self._pause_overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        self._pause_overlay.fill((0, 0, 0, 128))
+        
         self.clock = pygame.time.Clock()
         self.running = True
         self.current_state = GameState.MAIN_MENU
@@ -476,8 +582,14 @@ class GameDirector:
         self.current_wave = 1
         self.game_start_time = 0
         
+        # Capabilities probed once per game instead of with hasattr every frame
+        self._ship_has_update_cannon = False
+        self._ship_has_draw_cannon_effects = False
+        self._projectile_effect_linked = False
+        
         self.delta_time = 0.0
         self.last_frame_time = pygame.time.get_ticks()
+        self.frame_ticks = self.last_frame_time
         
         self.wave_completion_timer = 0
         self.show_controls = False
@@ -498,29 +610,34 @@ class GameDirector:
         current_time = pygame.time.get_ticks()
         self.delta_time = (current_time - self.last_frame_time) / 1000.0
         self.last_frame_time = current_time
+        self.frame_ticks = current_time
     
     def _handle_events(self):
-        events = pygame.event.get()
-        
-        for event in events:
-            if event.type == pygame.QUIT:
+        # Fetch only the handled types, in queue order so KEYDOWN/KEYUP pairs stay ordered
+        for event in pygame.event.get(_HANDLED_EVENTS):
+            event_type = event.type
+            if event_type == pygame.QUIT:
                 self.running = False
+                continue
             
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                if self.current_state == GameState.GAME_PLAYING:
-                    self.current_state = GameState.GAME_PAUSED
-                elif self.current_state == GameState.GAME_PAUSED:
-                    self.current_state = GameState.GAME_PLAYING
-                elif self.current_state == GameState.GAME_OVER:
-                    self.end_current_run()
-            
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_F1:
-                self.show_controls = not self.show_controls
+            if event_type == pygame.KEYDOWN:
+                key = event.key
+                if key == pygame.K_ESCAPE:
+                    if self.current_state == GameState.GAME_PLAYING:
+                        self.current_state = GameState.GAME_PAUSED
+                    elif self.current_state == GameState.GAME_PAUSED:
+                        self.current_state = GameState.GAME_PLAYING
+                    elif self.current_state == GameState.GAME_OVER:
+                        self.end_current_run()
+                elif key == pygame.K_F1:
+                    self.show_controls = not self.show_controls
+                
+                if self.current_state == GameState.MAIN_MENU:
+                    if key == pygame.K_RETURN:
+                        self.start_new_game("Breacher")
+                    continue
             
-            if self.current_state == GameState.MAIN_MENU:
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    self.start_new_game("Breacher")
-            elif self.current_state == GameState.GAME_PLAYING:
+            if self.current_state == GameState.GAME_PLAYING:
                 if self.input_manager and self.player_ship:
                     self.input_manager.handle_event(event, self.player_ship)
     
@@ -538,18 +655,18 @@ class GameDirector:
             self.input_manager.update(self.delta_time)
         
         self.player_ship.update(self.delta_time, keys_pressed)
-        if hasattr(self.player_ship, 'update_cannon'):
+        if self._ship_has_update_cannon:
             self.player_ship.update_cannon(self.delta_time)
         
-        living_enemies = []
+        living_enemies = ()
         if self.enemy_manager:
             self.enemy_manager.update(self.delta_time, self.player_ship)
-            living_enemies = [enemy for enemy in self.enemy_manager.enemies if enemy.alive]
+            living_enemies = self.enemy_manager.living_enemies
         
         if self.projectile_manager:
-            if self.effect_manager and not hasattr(self.projectile_manager, 'effect_manager_set'):
+            if self.effect_manager and not self._projectile_effect_linked:
                 self.projectile_manager.set_effect_manager(self.effect_manager)
-                self.projectile_manager.effect_manager_set = True
+                self._projectile_effect_linked = True
             
             self.projectile_manager.update(self.delta_time, living_enemies, self.player_ship)
         
@@ -557,6 +674,10 @@ class GameDirector:
             self.cannon_manager.update(self.delta_time, living_enemies, self.player_ship,
                                      self.screen.get_width(), self.screen.get_height())
         
+        if self.enemy_manager:
+            # Projectile and cannon hits land after the enemy update; republish so the HUD sees them this frame
+            self.enemy_manager.publish_debug()
+        
         if self.effect_manager:
             self.effect_manager.update(self.delta_time)
         
@@ -590,7 +711,7 @@ class GameDirector:
     def _render_game(self):
         if self.player_ship:
             self.player_ship.draw(self.screen)
-            if hasattr(self.player_ship, 'draw_cannon_effects'):
+            if self._ship_has_draw_cannon_effects:
                 self.player_ship.draw_cannon_effects(self.screen, self.effect_manager)
         
         if self.enemy_manager:
@@ -613,7 +734,7 @@ class GameDirector:
         if self.progression_manager and self.inventory_ui:
             ui_data = self.progression_manager.get_ui_data()
             
-            self.inventory_ui.draw_level_up_notification(self.screen, ui_data['player'])
+            self.inventory_ui.draw_level_up_notification(self.screen, ui_data['player'], self.frame_ticks)
             self.inventory_ui.draw_inventory(self.screen, ui_data['inventory'], ui_data['player'])
             self.inventory_ui.draw_stat_allocation(self.screen, ui_data['player'])
         
@@ -644,9 +765,7 @@ class GameDirector:
             self.screen.blit(text, (self.screen.get_width()//2 - text.get_width()//2, y_pos))
     
     def _render_pause_overlay(self):
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._pause_overlay, (0, 0))
         
         font = pygame.font.Font(None, 72)
         pause_text = font.render("PAUSED", True, (255, 255, 255))
@@ -688,6 +807,9 @@ class GameDirector:
         
         # Create player ship
         self.player_ship = self._create_player_ship(ship_type)
+        self._ship_has_update_cannon = hasattr(self.player_ship, 'update_cannon')
+        self._ship_has_draw_cannon_effects = hasattr(self.player_ship, 'draw_cannon_effects')
+        self._projectile_effect_linked = False
         
         # Connect damage flash
         if hasattr(self.player_ship, 'set_hud_renderer'):
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+from collections import OrderedDict
+
+
+class TextSurfaceCache:
+    """LRU cache of rendered text surfaces, shared by the HUD, inventory UI and floating texts"""
+
+    def __init__(self, limit=512, convert_alpha=False):
+        self._entries = OrderedDict()
+        self.limit = limit
+        self.convert_alpha = convert_alpha  # Display-format copies take SDL's same-format blit path
+
+    def get(self, key):
+        """Get a cached entry (marking it recently used), or None"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """Store an entry, evicting the least recently used one past the limit"""
+        self._entries[key] = entry
+        if len(self._entries) > self.limit:
+            self._entries.popitem(last=False)
+        return entry
+
+    def render(self, font, text, color):
+        """Render text through the cache, keyed by (font, text, color)"""
+        key = (id(font), text, color)
+        surface = self.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            if self.convert_alpha:
+                surface = surface.convert_alpha()
+            self.put(key, surface)
+        return surface
+
+    def clear(self):
+        """Drop every cached entry"""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
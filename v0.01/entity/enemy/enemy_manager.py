@@ -2,6 +2,17 @@
 import pygame
 import math
 import random
+import logging
+import numpy as np
+from operator import attrgetter
+
+log = logging.getLogger(__name__)
+
+# Counting via map/sum keeps the per-enemy loop in C for the per-frame HUD queries
+_is_alive = attrgetter('alive')
+
+# Slots of EnemyManager.debug_arr
+DEBUG_ACTIVE, DEBUG_TO_SPAWN, DEBUG_KILLED, DEBUG_WAVE = range(4)
 
 class BasicEnemy:
     """Enemy with progression integration"""
@@ -51,7 +62,8 @@ class BasicEnemy:
         self.exp_value = self._calculate_exp_value()
         self.drop_level = level  # Used for drop calculation
         
-        print(f"Created {enemy_type} L{level}: HP={self.max_hp}J, EXP={self.exp_value}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Created %s L%d: HP=%sJ, EXP=%s", enemy_type, level, self.max_hp, self.exp_value)
     
     def _calculate_realistic_hp(self, enemy_type, level):
         """Calculate HP based on constants and type"""
@@ -151,7 +163,9 @@ class BasicEnemy:
         original_hp = self.current_hp
         self.current_hp -= damage_joules
         
-        print(f"{self.enemy_type} L{self.level} took {damage_joules:.1f}J damage ({original_hp:.0f} -> {self.current_hp:.0f}J)")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s L%d took %.1fJ damage (%.0f -> %.0fJ)",
+                      self.enemy_type, self.level, damage_joules, original_hp, self.current_hp)
         
         # Apply knockback
         if damage_joules > 100:
@@ -165,7 +179,8 @@ class BasicEnemy:
             self.current_hp = 0
             self.alive = False
             self.active = False
-            print(f"{self.enemy_type} L{self.level} destroyed! Worth {self.exp_value} EXP")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("%s L%d destroyed! Worth %s EXP", self.enemy_type, self.level, self.exp_value)
             return True
         
         return False
@@ -227,6 +242,7 @@ class EnemyManager:
         
         # Enemy tracking
         self.enemies = []
+        self.living_enemies = []  # Reused every frame; rebuilt in place by update()
         self.enemies_killed_this_wave = 0
         self.total_enemies_killed = 0
         
@@ -244,6 +260,10 @@ class EnemyManager:
         # Progression integration
         self.input_manager = None  # Set by GameDirector
         
+        # HUD stats published in place (see DEBUG_* slots) instead of a dict per frame
+        self.debug_arr = np.zeros(4, dtype=np.int32)
+        self.publish_debug()
+        
         print(f"EnemyManager with progression: Scale={self.scale_factor:.3f}")
     
     def set_input_manager(self, input_manager):
@@ -276,6 +296,7 @@ class EnemyManager:
         
         # Spawn rate
         self.spawn_interval = max(0.5, 2.0 - (wave_number * 0.1))
+        self.publish_debug()
         
         print(f"Starting wave {wave_number} - {self.enemies_to_spawn} enemies")
     
@@ -288,8 +309,10 @@ class EnemyManager:
                 self._spawn_enemy()
                 self.spawn_timer = 0
         
-        # Update existing enemies
-        for enemy in self.enemies[:]:
+        # Update existing enemies, compacting survivors to the front (swap-and-truncate)
+        enemies = self.enemies
+        write = 0
+        for enemy in enemies:
             if enemy.alive:
                 enemy.update(delta_time, player_ship, self.screen_width, self.screen_height)
             
@@ -301,28 +324,33 @@ class EnemyManager:
                         enemy.level, enemy.enemy_type
                     )
                     
-                    if progression_result:
-                        print(f"Player gained {progression_result['exp_gained']} EXP")
+                    if progression_result and log.isEnabledFor(logging.DEBUG):
+                        log.debug("Player gained %d EXP", progression_result['exp_gained'])
                         if progression_result['leveled_up']:
-                            print("PLAYER LEVELED UP!")
-                        if progression_result['drop']:
-                            drop = progression_result['drop']
-                            print(f"Dropped: {drop['amount']} {drop['type']}")
+                            log.debug("PLAYER LEVELED UP!")
+                        for drop in progression_result.get('drops', ()):
+                            log.debug("Dropped: %d %s", drop['amount'], drop['type'])
                 
                 self.enemies_killed_this_wave += 1
                 self.total_enemies_killed += 1
-                self.enemies.remove(enemy)
             
-            # Remove off-screen enemies
-            elif enemy.is_off_screen(self.screen_height):
-                self.enemies.remove(enemy)
+            # Keep on-screen survivors
+            elif not enemy.is_off_screen(self.screen_height):
+                enemies[write] = enemy
+                write += 1
+        del enemies[write:]
+        
+        living = self.living_enemies
+        living.clear()
+        living.extend(enemies)
         
         # Check wave completion
-        living_enemies = sum(1 for enemy in self.enemies if enemy.alive)
-        if self.enemies_to_spawn <= 0 and living_enemies == 0 and not self.wave_complete:
+        if self.enemies_to_spawn <= 0 and not living and not self.wave_complete:
             self.wave_complete = True
             self.wave_completion_timer = delta_time
             print(f"Wave {self.current_wave} complete!")
+        
+        self.publish_debug()
     
     def _spawn_enemy(self):
         """Spawn new enemy with appropriate level"""
@@ -358,13 +386,15 @@ class EnemyManager:
     
     def get_enemy_count(self):
         """Get living enemy count"""
-        return sum(1 for enemy in self.enemies if enemy.alive)
+        return sum(map(_is_alive, self.enemies))
     
     def clear_all_enemies(self):
         """Clear all enemies"""
         self.enemies.clear()
+        self.living_enemies.clear()
         self.enemies_to_spawn = 0
         self.wave_complete = False
+        self.publish_debug()
     
     def draw(self, screen):
         """Draw all living enemies"""
@@ -372,9 +402,17 @@ class EnemyManager:
             if enemy.alive:
                 enemy.draw(screen)
     
+    def publish_debug(self):
+        """Refresh the per-frame counters in debug_arr; call again after other systems kill enemies"""
+        arr = self.debug_arr
+        arr[DEBUG_ACTIVE] = sum(map(_is_alive, self.enemies))
+        arr[DEBUG_TO_SPAWN] = self.enemies_to_spawn
+        arr[DEBUG_KILLED] = self.enemies_killed_this_wave
+        arr[DEBUG_WAVE] = self.current_wave
+    
     def debug_info(self):
         """Return debug information"""
-        living_enemies = sum(1 for enemy in self.enemies if enemy.alive)
+        living_enemies = sum(map(_is_alive, self.enemies))
         return {
             "wave": self.current_wave,
             "enemies_active": living_enemies,
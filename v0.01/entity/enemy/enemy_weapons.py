@@ -83,6 +83,7 @@ class EnemyWeapon:
         projectile_data = {
             'mass_kg': 0.01,
             'velocity_kmh': self.projectile_speed * 3.6,
+            'velocity_ms': self.projectile_speed,
             'damage_base': self.damage,
             'projectile_type': self.weapon_type
         }
@@ -141,6 +142,7 @@ class EnemyMissileLauncher(EnemyWeapon):
         projectile_data = {
             'mass_kg': 0.5,
             'velocity_kmh': self.projectile_speed * 3.6,
+            'velocity_ms': self.projectile_speed,
             'damage_base': self.damage,
             'projectile_type': 'homing_missile',
             'homing': True,
@@ -203,13 +205,11 @@ class EnemyWeaponSystem:
         
         current_time = pygame.time.get_ticks() / 1000.0
         
-        # Check if player is in range
-        distance_to_player = math.hypot(
-            player_ship.x - owner_position[0],
-            player_ship.y - owner_position[1]
-        )
+        # Check if player is in range (squared, no sqrt needed)
+        dx = player_ship.x - owner_position[0]
+        dy = player_ship.y - owner_position[1]
         
-        if distance_to_player > self.firing_range:
+        if dx * dx + dy * dy > self.firing_range * self.firing_range:
             return
         
         # Get player velocity for lead targeting
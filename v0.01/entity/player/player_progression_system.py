@@ -1,7 +1,34 @@
 #!/usr/bin/env python3
 import pygame
+import logging
 import math
 import random
+from enum import IntEnum
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+
+class Effect(IntEnum):
+    """Perk effect slots, indexing PerkSystem's effect multiplier array"""
+    EXPLOSIVE_DAMAGE_MULT = 0
+    SHIELD_CAPACITY_MULT = 1
+    COOLDOWN_MULT = 2
+    DROP_CHANCE_MULT = 3
+
+
+class Modifier(IntEnum):
+    """Weapon/ship modifier slots, indexing ProgressionManager's modifier vector"""
+    EXPLOSIVE_BONUS_KG = 0
+    DAMAGE_RESISTANCE = 1
+    DODGE_CHANCE = 2
+    SHIELD_CAPACITY_BONUS = 3
+    SHIELD_REGEN_BONUS = 4
+    EXPLOSIVE_DAMAGE_MULT = 5
+    COOLDOWN_MULT = 6
+    SHIELD_CAPACITY_MULT = 7
+
+NUM_MODIFIER_SLOTS = len(Modifier)
 
 class PlayerStats:
     """Player character stats and progression"""
@@ -9,7 +36,8 @@ class PlayerStats:
     def __init__(self):
         # Core stats
         self.level = 1
-        self.experience = 0
+        self.experience = 0        # Progress into the current level
+        self.total_experience = 0  # Everything ever earned; the level is derived from it
         self.stat_points = 0
         
         # Base attributes
@@ -25,31 +53,50 @@ class PlayerStats:
         self.shield_capacity_bonus = 0
         self.shield_regen_bonus = 0
         
+        # Cached views, dropped whenever the state they are built from changes
+        self._exp_req_cache = None
+        self._summary_cache = None
+        self.derived_version = 0  # Bumped whenever the derived stats change
+        
         self._calculate_derived_stats()
         
     def add_experience(self, exp_amount):
         """Add experience and check for level up"""
-        self.experience += exp_amount
+        self.total_experience += exp_amount
         old_level = self.level
         
-        while self.experience >= self.get_exp_requirement():
-            self.level_up()
+        # Any number of level ups at once, straight from the cumulative total
+        new_level = self.get_level_for_experience(self.total_experience)
+        if new_level > old_level:
+            self.level = new_level
+            self.stat_points += new_level - old_level
+            self._exp_req_cache = None
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("LEVEL UP! Now level %d", self.level)
+        self.experience = self.total_experience - self.get_total_exp_for_level(self.level)
+        self._summary_cache = None
         
         return self.level > old_level  # Return True if leveled up
     
     def get_exp_requirement(self):
         """Get experience required for next level"""
-        return 100 + (self.level - 1) * 50  # 100, 150, 200, 250...
+        if self._exp_req_cache is None:
+            self._exp_req_cache = 100 + (self.level - 1) * 50  # 100, 150, 200, 250...
+        return self._exp_req_cache
     
-    def level_up(self):
-        """Level up the player"""
-        exp_required = self.get_exp_requirement()
-        self.experience -= exp_required
-        self.level += 1
-        self.stat_points += 1
-        
-        print(f"LEVEL UP! Now level {self.level}")
-        return True
+    @staticmethod
+    def get_total_exp_for_level(level):
+        """Get cumulative experience needed to reach a level from level 1"""
+        # Sum of the per-level requirements: 100n + 50 * n(n-1)/2 for n = level - 1
+        n = level - 1
+        return 100 * n + 25 * n * (n - 1)
+    
+    @staticmethod
+    def get_level_for_experience(total_experience):
+        """Get the level reached with a cumulative amount of experience"""
+        # Largest n with 25n^2 + 75n <= total; isqrt keeps it exact for any total. Level
+        # thresholds are whole numbers, so flooring fractional experience does not change the level
+        return 1 + (math.isqrt(5625 + 100 * math.floor(total_experience)) - 75) // 50
     
     def allocate_stat_point(self, stat_name):
         """Allocate a stat point to an attribute"""
@@ -69,7 +116,10 @@ class PlayerStats:
         
         self.stat_points -= 1
         self._calculate_derived_stats()
-        print(f"Allocated point to {stat_name}. Remaining points: {self.stat_points}")
+        self._summary_cache = None
+        self.derived_version += 1
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Allocated point to %s. Remaining points: %d", stat_name, self.stat_points)
         return True
     
     def _calculate_derived_stats(self):
@@ -82,6 +132,12 @@ class PlayerStats:
     
     def get_stat_summary(self):
         """Get formatted stat summary"""
+        if self._summary_cache is None:
+            self._summary_cache = self._build_stat_summary()
+        return self._summary_cache
+    
+    def _build_stat_summary(self):
+        """Build the stat summary dict"""
         return {
             'level': self.level,
             'experience': self.experience,
@@ -107,9 +163,11 @@ class DropSystem:
         
     def check_drop(self, enemy_level=1):
         """Check if enemy drops items"""
-        if random.random() < self.drop_chance:
-            # Calculate Kerr Scrap amount based on enemy level
-            base_scrap = random.randint(1, 3)
+        roll = random.random()
+        if roll < self.drop_chance:
+            # Calculate Kerr Scrap amount based on enemy level; a roll under the drop chance is
+            # still uniform over it, so the same roll also picks the 1-3 base scrap
+            base_scrap = 1 + min(2, int(roll * 3 / self.drop_chance))
             level_bonus = enemy_level - 1
             total_scrap = base_scrap + level_bonus
             
@@ -133,7 +191,8 @@ class Inventory:
         """Add item to inventory"""
         if item_type == 'kerr_scrap':
             self.kerr_scrap += amount
-            print(f"Collected {amount} Kerr Scrap! Total: {self.kerr_scrap}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Collected %d Kerr Scrap! Total: %d", amount, self.kerr_scrap)
             return True
         
         if item_type not in self.items:
@@ -159,7 +218,8 @@ class Inventory:
     def toggle_visibility(self):
         """Toggle inventory display"""
         self.visible = not self.visible
-        print(f"Inventory {'opened' if self.visible else 'closed'}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Inventory %s", "opened" if self.visible else "closed")
         return self.visible
     
     def get_inventory_data(self):
@@ -176,78 +236,89 @@ class PerkSystem:
     
     def __init__(self, inventory):
         self.inventory = inventory
-        self.active_perks = set()
         
-        # Perk definitions
+        # Perk definitions (names/descriptions for the UI; effects are also packed into arrays below)
         self.perks = {
             'explosive_master': {
                 'name': 'Explosive Master',
                 'description': '+25% explosive damage',
                 'cost': 50,
-                'effect': 'explosive_damage_mult',
+                'effect': Effect.EXPLOSIVE_DAMAGE_MULT,
                 'value': 1.25
             },
             'shield_boost': {
                 'name': 'Shield Booster',
                 'description': '+50% shield capacity',
                 'cost': 40,
-                'effect': 'shield_capacity_mult',
+                'effect': Effect.SHIELD_CAPACITY_MULT,
                 'value': 1.5
             },
             'rapid_reload': {
                 'name': 'Rapid Reload',
                 'description': '-25% weapon cooldowns',
                 'cost': 60,
-                'effect': 'cooldown_mult',
+                'effect': Effect.COOLDOWN_MULT,
                 'value': 0.75
             },
             'lucky_drops': {
                 'name': 'Lucky Drops',
                 'description': '+50% drop chance',
                 'cost': 30,
-                'effect': 'drop_chance_mult',
+                'effect': Effect.DROP_CHANCE_MULT,
                 'value': 1.5
             }
         }
+        
+        # Flat per-perk arrays indexed by integer perk index
+        self.perk_ids = tuple(self.perks)
+        self._perk_index = {perk_id: index for index, perk_id in enumerate(self.perk_ids)}
+        self.perk_costs = np.array([perk['cost'] for perk in self.perks.values()], dtype=np.int64)
+        self.perk_effects = np.array([perk['effect'] for perk in self.perks.values()], dtype=np.intp)
+        self.perk_values = np.array([perk['value'] for perk in self.perks.values()], dtype=np.float64)
+        self.active_mask = np.zeros(len(self.perk_ids), dtype=bool)
+        
+        # One multiplier per Effect, rebuilt only when a purchase flips a bit in active_mask
+        self._effects_array = np.ones(len(Effect), dtype=np.float64)
+        self.effects_version = 0  # Bumped whenever _effects_array changes
+    
+    @property
+    def active_perks(self):
+        """Ids of the purchased perks"""
+        return {self.perk_ids[index] for index in np.flatnonzero(self.active_mask).tolist()}
     
     def can_purchase(self, perk_id):
         """Check if perk can be purchased"""
-        if perk_id not in self.perks:
-            return False
-        if perk_id in self.active_perks:
+        index = self._perk_index.get(perk_id)
+        if index is None or self.active_mask[index]:
             return False
         
-        perk = self.perks[perk_id]
-        return self.inventory.kerr_scrap >= perk['cost']
+        return self.inventory.kerr_scrap >= self.perk_costs[index]
     
     def purchase_perk(self, perk_id):
         """Purchase a perk"""
         if not self.can_purchase(perk_id):
             return False
         
-        perk = self.perks[perk_id]
-        if self.inventory.remove_item('kerr_scrap', perk['cost']):
-            self.active_perks.add(perk_id)
-            print(f"Purchased perk: {perk['name']}")
+        index = self._perk_index[perk_id]
+        if self.inventory.remove_item('kerr_scrap', int(self.perk_costs[index])):
+            self.active_mask[index] = True
+            self._rebuild_active_effects()
+            self.effects_version += 1
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Purchased perk: %s", self.perks[perk_id]['name'])
             return True
         return False
     
     def get_active_effects(self):
-        """Get all active perk effects"""
-        effects = {}
-        for perk_id in self.active_perks:
-            perk = self.perks[perk_id]
-            effect_name = perk['effect']
-            if effect_name not in effects:
-                effects[effect_name] = 1.0
-            
-            # Apply multiplicative effects
-            if 'mult' in effect_name:
-                effects[effect_name] *= perk['value']
-            else:
-                effects[effect_name] += perk['value']
-        
-        return effects
+        """Get all active perk effects as one multiplier per Effect slot"""
+        return self._effects_array
+    
+    def _rebuild_active_effects(self):
+        """Combine the active perks into one multiplier per effect"""
+        effects = self._effects_array
+        effects.fill(1.0)
+        active = self.active_mask
+        np.multiply.at(effects, self.perk_effects[active], self.perk_values[active])
 
 
 class ProgressionManager:
@@ -259,6 +330,13 @@ class ProgressionManager:
         self.inventory = Inventory()
         self.perk_system = PerkSystem(self.inventory)
         
+        # Stats and perks folded into one vector, rebuilt only when either one's version moves
+        self._base_drop_chance = self.drop_system.drop_chance
+        self._modifier_vec = np.zeros(NUM_MODIFIER_SLOTS, dtype=np.float64)
+        self._modifiers = {}
+        self._modifier_versions = None
+        self._refresh_modifiers()
+        
         # UI state
         self.show_level_up = False
         self.level_up_timer = 0
@@ -278,7 +356,8 @@ class ProgressionManager:
             self.show_level_up = True
             self.level_up_timer = 3.0
         
-        # Check for drops
+        # Check for drops (with the current drop chance perk applied)
+        self._refresh_modifiers()
         drop = self.drop_system.check_drop(enemy_level)
         if drop:
             self.inventory.add_item(drop['type'], drop['amount'])
@@ -323,29 +402,35 @@ class ProgressionManager:
         
         return False
     
-    def get_weapon_modifiers(self):
-        """Get weapon modifiers based on stats"""
-        modifiers = {
-            'explosive_bonus_kg': self.player_stats.explosive_bonus_kg,
-            'damage_resistance': self.player_stats.damage_resistance,
-            'dodge_chance': self.player_stats.dodge_chance,
-            'shield_capacity_bonus': self.player_stats.shield_capacity_bonus,
-            'shield_regen_bonus': self.player_stats.shield_regen_bonus
-        }
+    def _refresh_modifiers(self):
+        """Fold current stats and perk effects into the modifier vector if either has changed"""
+        stats = self.player_stats
+        versions = (stats.derived_version, self.perk_system.effects_version)
+        if versions == self._modifier_versions:
+            return
+        self._modifier_versions = versions
         
-        # Apply perk effects
         perk_effects = self.perk_system.get_active_effects()
-        for effect, value in perk_effects.items():
-            if effect == 'explosive_damage_mult':
-                modifiers['explosive_damage_mult'] = value
-            elif effect == 'cooldown_mult':
-                modifiers['cooldown_mult'] = value
-            elif effect == 'shield_capacity_mult':
-                modifiers['shield_capacity_mult'] = value
-            elif effect == 'drop_chance_mult':
-                self.drop_system.drop_chance *= value
+        vec = self._modifier_vec
+        vec[Modifier.EXPLOSIVE_BONUS_KG] = stats.explosive_bonus_kg
+        vec[Modifier.DAMAGE_RESISTANCE] = stats.damage_resistance
+        vec[Modifier.DODGE_CHANCE] = stats.dodge_chance
+        vec[Modifier.SHIELD_CAPACITY_BONUS] = stats.shield_capacity_bonus
+        vec[Modifier.SHIELD_REGEN_BONUS] = stats.shield_regen_bonus
+        vec[Modifier.EXPLOSIVE_DAMAGE_MULT] = perk_effects[Effect.EXPLOSIVE_DAMAGE_MULT]
+        vec[Modifier.COOLDOWN_MULT] = perk_effects[Effect.COOLDOWN_MULT]
+        vec[Modifier.SHIELD_CAPACITY_MULT] = perk_effects[Effect.SHIELD_CAPACITY_MULT]
+        
+        # Set from the base chance so repeated refreshes never compound the perk
+        self.drop_system.drop_chance = self._base_drop_chance * float(perk_effects[Effect.DROP_CHANCE_MULT])
         
-        return modifiers
+        # Keyed copy for ships that take their modifiers as a dict
+        self._modifiers = dict(zip((slot.name.lower() for slot in Modifier), vec.tolist()))
+    
+    def get_weapon_modifiers(self):
+        """Get weapon modifiers based on stats"""
+        self._refresh_modifiers()
+        return self._modifiers
     
     def get_ui_data(self):
         """Get data for UI rendering"""
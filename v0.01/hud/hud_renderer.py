@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import pygame
 import math
+from text_cache import TextSurfaceCache
 
 class HUDRenderer:
     """HUD renderer with 0.6% screen scaling and inertia physics display"""
@@ -13,15 +14,29 @@ class HUDRenderer:
         self.scale_factor = 0.006
         self.base_size = min(screen_width, screen_height) * self.scale_factor
         
+        # Layout scale relative to the 13px reference size; every derived size is computed once here
+        self._s = self.base_size / 13.0
+        s = self._s
+        
         # HUD layout configuration - all scaled
-        self.margin = max(10, int(20 * (self.base_size / 13)))
-        self.bar_height = max(12, int(24 * (self.base_size / 13)))
-        self.bar_width = max(150, int(300 * (self.base_size / 13)))
+        self.margin = max(10, int(20 * s))
+        self.bar_height = max(12, int(24 * s))
+        self.bar_width = max(150, int(300 * s))
         
         # Font sizes - scaled
-        self.font_size_large = max(16, int(32 * (self.base_size / 13)))
-        self.font_size_medium = max(12, int(24 * (self.base_size / 13)))
-        self.font_size_small = max(9, int(18 * (self.base_size / 13)))
+        self.font_size_large = max(16, int(32 * s))
+        self.font_size_medium = max(12, int(24 * s))
+        self.font_size_small = max(9, int(18 * s))
+        
+        # Panel and info-area sizes - scaled
+        self._info_offset_x = max(200, int(250 * s))
+        self._weapon_info_offset_y = max(60, int(120 * s))
+        self._sys_info_w = max(150, int(300 * s))
+        self._sys_info_offset_y = max(40, int(80 * s))
+        self._panel_w_controls = max(150, int(200 * s))
+        self._line_height_controls = max(12, int(25 * s))
+        self._panel_w_wave_complete = max(200, int(400 * s))
+        self._panel_h_wave_complete = max(50, int(100 * s))
         
         # Fonts
         self.font_large = pygame.font.Font(None, self.font_size_large)
@@ -45,12 +60,79 @@ class HUDRenderer:
             'physics_debug': (255, 255, 0)
         }
         
+        # The same colors as plain attributes (c_hp_bar, c_text_primary, ...) for the draw paths
+        for name, color in self.colors.items():
+            setattr(self, 'c_' + name, color)
+        
         # HUD element positions
         self.positions = self._calculate_positions()
         
+        # Bar widgets (background + fill + label) composited into one surface each, redrawn only when the
+        # values they show change: name -> [last state, surface, label blit if it overflows, widget blit]
+        self._bar_widgets = {}
+        for name, bg, pos_key in (('hp', 'hp_bg', 'hp_bar'), ('shield', 'shield_bg', 'shield_bar'),
+                                  ('heat', 'cannon_heat_bg', 'cannon_heat')):
+            surface = self._make_bar_surface(self.colors[bg])
+            self._bar_widgets[name] = [None, surface, None, (surface, self.positions[pos_key])]
+        
+        # HUD blits collected during draw() and issued in a single blits() call
+        self._blit_queue = []
+        
+        # Last state and (surface, position) blit per formatted HUD line, keyed by line name
+        self._text_lines = {}
+        
+        # Cooldown row positions under the ship line, extended as more weapons appear
+        self._weapon_row_positions = []
+        
+        # All-ready cooldown rows, reused while no weapon is cooling down: (weapon keys, blits)
+        self._ready_rows = ((), [])
+        
+        # Ship the capability flags below were probed from
+        self._ship = None
+        self._ship_has_cannon = False
+        self._ship_has_velocity = False
+        self._ship_has_cooldowns = False
+        self._ship_has_overcharge = False
+        
+        # Display labels per weapon key: ("<name>: " prefix for timers, "<name>: READY")
+        self._weapon_label_cache = {}
+        
+        # Full-screen damage flash, faded with surface alpha instead of reallocated per frame
+        self._damage_flash_surface = pygame.Surface((self.screen_width, self.screen_height))
+        self._damage_flash_surface.fill((255, 0, 0))
+        
+        # Solid HUD surfaces are converted to the screen's pixel format on the first draw()
+        self._format_matched = False
+        
+        # Controls help overlay, pre-rendered on first use
+        self._controls_help_surface = None
+        self._controls_help_pos = (0, 0)
+        
+        # Game over blits, rebuilt only when the shown stats change: (wave, kills, survival time to 0.1s)
+        self._game_over_overlay = None
+        self._game_over_key = None
+        self._game_over_blits = ()
+        
+        # Wave complete panel with its texts baked in, rebuilt only when (wave, timer to 0.1s) changes
+        self._wave_complete_surface = None
+        self._wave_complete_key = None
+        self._wave_complete_pos = (self.screen_width//2 - self._panel_w_wave_complete//2,
+                                   self.screen_height//2 - self._panel_h_wave_complete//2)
+        
         # Animation states
         self.damage_flash_timer = 0
         self.low_health_pulse = 0
+        self._low_health_pulse_level = 0  # abs(sin(low_health_pulse)) in 16 steps, refreshed in update()
+        
+        # Hull bar colors for each pulse level, and the cannon color ramp above 80% heat
+        self._hp_pulse_table = tuple((255, int(50 + 100 * (i / 15)), int(50 * (i / 15))) for i in range(16))
+        self._heat_hot_steps = 32
+        self._heat_hot_table = tuple((255, int(200 * (0.2 - 0.2 * i / self._heat_hot_steps)), 50)
+                                     for i in range(self._heat_hot_steps))
+        
+        # Rendered HUD text, keyed by (font, text, color); most values change far less often than frames
+        self._text_cache = TextSurfaceCache(convert_alpha=True)
+        self._render_cached = self._text_cache.render
         
         print(f"HUD initialized: Scale={self.scale_factor:.3f}, Base size={self.base_size:.1f}px")
     
@@ -63,34 +145,133 @@ class HUDRenderer:
         positions['shield_bar'] = (self.margin, self.margin + self.bar_height + 10)
         positions['cannon_heat'] = (self.margin, self.margin + (self.bar_height + 10) * 2)
         positions['physics_info'] = (self.margin, self.margin + (self.bar_height + 10) * 3)
+        positions['kinetic_info'] = (self.margin, positions['physics_info'][1] + 20)
+        positions['mass_info'] = (self.margin, positions['physics_info'][1] + 40)
         
         # Top-right info area
-        info_x = self.screen_width - max(200, int(250 * (self.base_size / 13)))
+        info_x = self.screen_width - self._info_offset_x
         positions['wave_info'] = (info_x, self.margin)
         positions['score_info'] = (info_x, self.margin + 40)
         positions['enemy_count'] = (info_x, self.margin + 80)
+        positions['kills_info'] = (info_x, self.margin + 110)
+        positions['enemy_scale_info'] = (info_x, self.margin + 135)
         
         # Bottom-left weapon info
-        positions['weapon_info'] = (self.margin, self.screen_height - max(60, int(120 * (self.base_size / 13))))
+        positions['weapon_info'] = (self.margin, self.screen_height - self._weapon_info_offset_y)
         
         # Bottom-right system info
-        positions['system_info'] = (self.screen_width - max(150, int(300 * (self.base_size / 13))), 
-                                   self.screen_height - max(40, int(80 * (self.base_size / 13))))
+        positions['system_info'] = (self.screen_width - self._sys_info_w,
+                                   self.screen_height - self._sys_info_offset_y)
+        positions['system_scale_info'] = (positions['system_info'][0], positions['system_info'][1] + 20)
+        
+        # Centers for the centered overlay texts (the game over stats lines step down 40px from the first)
+        center_x = self.screen_width//2
+        center_y = self.screen_height//2
+        positions['game_over_title'] = (center_x, center_y - 100)
+        positions['game_over_stats'] = (center_x, center_y - 20)
+        positions['game_over_restart'] = (center_x, center_y + 150)
+        positions['wave_complete_title'] = (self._panel_w_wave_complete//2, self._panel_h_wave_complete//3)
+        positions['wave_complete_timer'] = (self._panel_w_wave_complete//2, self._panel_h_wave_complete*2//3)
         
         return positions
     
+    @staticmethod
+    def _centered(surface, center):
+        """Top-left position that centers surface on center, without building a Rect"""
+        w, h = surface.get_size()
+        return (center[0] - (w >> 1), center[1] - (h >> 1))
+    
+    def _make_bar_surface(self, color):
+        """Create a solid bar-sized surface"""
+        surface = pygame.Surface((self.bar_width, self.bar_height))
+        surface.fill(color)
+        return surface
+    
+    def _queue_bar_widget(self, name, bg_color, fill_width, fill_color, text_fmt, text_values, text_color):
+        """Queue a bar widget, recompositing it only if its state changed since the last frame"""
+        widget = self._bar_widgets[name]
+        state = (fill_width, fill_color if fill_width > 0 else None, text_fmt, text_values, text_color)
+        if widget[0] != state:
+            text = text_fmt.format(*text_values)
+            surface = widget[1]
+            surface.fill(bg_color)
+            if fill_width > 0:
+                surface.fill(fill_color, (0, 0, fill_width, self.bar_height))
+            
+            # The label is baked in when it fits inside the opaque bar, which blends identically
+            text_surface = self._render_cached(self.font_medium, text, text_color)
+            text_w, text_h = text_surface.get_size()
+            text_x = self.bar_width//2 - text_w//2
+            text_y = self.bar_height//2 - text_h//2
+            if text_x >= 0 and text_y >= 0 and text_w <= self.bar_width and text_h <= self.bar_height:
+                surface.blit(text_surface, (text_x, text_y))
+                widget[2] = None
+            else:
+                pos = widget[3][1]
+                widget[2] = (text_surface, (pos[0] + text_x, pos[1] + text_y))
+            widget[0] = state
+        
+        self._blit_queue.append(widget[3])
+        if widget[2] is not None:
+            self._blit_queue.append(widget[2])
+    
+    def _queue_text_line(self, name, font, text_fmt, text_values, color, pos, label=None):
+        """Queue a HUD text line, formatting it only when its quantized values change"""
+        line = self._text_lines.get(name)
+        state = (text_fmt, text_values, color)
+        if line is None or line[0] != state:
+            text = text_fmt.format(*text_values)
+            if label is None:
+                blits = ((self._render_cached(font, text, color), pos),)
+            else:
+                blits = self._labeled_value_blits(font, label, text, color, pos)
+            line = (state, blits)
+            self._text_lines[name] = line
+        self._blit_queue.extend(line[1])
+    
+    def _labeled_value_blits(self, font, label, value_text, color, pos):
+        """Blits for a fixed label followed by a changing value, so only the value is rasterized anew"""
+        label_surface = self._render_cached(font, label, color)
+        value_surface = self._render_cached(font, value_text, color)
+        return ((label_surface, pos), (value_surface, (pos[0] + label_surface.get_width(), pos[1])))
+    
     def update(self, delta_time):
         """Update HUD animations"""
         if self.damage_flash_timer > 0:
             self.damage_flash_timer -= delta_time
         
         self.low_health_pulse += delta_time * 4
+        # Quantized to 16 levels so the pulsing hull bar has a small, stable set of states
+        self._low_health_pulse_level = int(abs(math.sin(self.low_health_pulse)) * 15 + 0.5)
+    
+    def _match_screen_format(self, screen):
+        """Convert the solid bar and flash surfaces to the screen's pixel format"""
+        for widget in self._bar_widgets.values():
+            surface = widget[1].convert(screen)
+            widget[1] = surface
+            widget[3] = (surface, widget[3][1])
+        self._damage_flash_surface = self._damage_flash_surface.convert(screen)
+        self._format_matched = True
     
     def draw(self, screen, player_ship, current_wave, enemy_manager=None, projectile_manager=None):
         """Draw complete HUD with inertia physics display"""
         if not player_ship:
             return
         
+        if not self._format_matched:
+            self._match_screen_format(screen)
+        
+        # Optional ship features are probed once per ship rather than every frame
+        if player_ship is not self._ship:
+            self._ship = player_ship
+            self._ship_has_cannon = hasattr(player_ship, 'universal_cannon')
+            self._ship_has_velocity = hasattr(player_ship, 'get_velocity')
+            self._ship_has_cooldowns = hasattr(player_ship, 'cooldowns')
+            self._ship_has_overcharge = hasattr(player_ship, 'overcharge_active')
+        
+        queue = self._blit_queue
+        queue.clear()
+        
         # Draw main HUD elements
         self._draw_health_bars(screen, player_ship)
         self._draw_wave_info(screen, current_wave, enemy_manager)
@@ -104,108 +285,82 @@ class HUDRenderer:
         # Draw damage indicator if active
         if self.damage_flash_timer > 0:
             self._draw_damage_indicator(screen)
+        
+        screen.blits(queue, False)
     
     def _draw_health_bars(self, screen, player_ship):
         """Draw HP and shield bars with joule values"""
         # HP Bar
-        hp_pos = self.positions['hp_bar']
         hp_ratio = max(0, player_ship.current_hp / player_ship.max_hp)
         
-        # Background
-        pygame.draw.rect(screen, self.colors['hp_bg'], 
-                        (hp_pos[0], hp_pos[1], self.bar_width, self.bar_height))
-        
         # HP fill with low health warning
-        hp_color = self.colors['hp_bar']
+        hp_color = self.c_hp_bar
         if hp_ratio < 0.25:
-            pulse = abs(math.sin(self.low_health_pulse))
-            hp_color = (255, int(50 + 100 * pulse), int(50 * pulse))
+            hp_color = self._hp_pulse_table[self._low_health_pulse_level]
         
         hp_fill_width = int(self.bar_width * hp_ratio)
-        if hp_fill_width > 0:
-            pygame.draw.rect(screen, hp_color,
-                            (hp_pos[0], hp_pos[1], hp_fill_width, self.bar_height))
         
-        # HP text with joule values
-        hp_text = f"Hull: {int(player_ship.current_hp)}J / {int(player_ship.max_hp)}J"
-        text_surface = self.font_medium.render(hp_text, True, self.colors['text_primary'])
-        text_rect = text_surface.get_rect(center=(hp_pos[0] + self.bar_width//2, hp_pos[1] + self.bar_height//2))
-        screen.blit(text_surface, text_rect)
+        # HP text with joule values, keyed by the displayed integers
+        hp_values = (int(player_ship.current_hp), int(player_ship.max_hp))
+        self._queue_bar_widget('hp', self.c_hp_bg,
+                               hp_fill_width, hp_color, "Hull: {}J / {}J", hp_values, self.c_text_primary)
         
         # Shield Bar
-        shield_pos = self.positions['shield_bar']
         shield_ratio = max(0, player_ship.current_shield / player_ship.max_shield)
-        
-        # Background
-        pygame.draw.rect(screen, self.colors['shield_bg'],
-                        (shield_pos[0], shield_pos[1], self.bar_width, self.bar_height))
-        
-        # Shield fill
         shield_fill_width = int(self.bar_width * shield_ratio)
-        if shield_fill_width > 0:
-            pygame.draw.rect(screen, self.colors['shield_bar'],
-                            (shield_pos[0], shield_pos[1], shield_fill_width, self.bar_height))
         
         # Shield text with joule values
-        shield_text = f"Shield: {int(player_ship.current_shield)}J / {int(player_ship.max_shield)}J"
-        text_surface = self.font_medium.render(shield_text, True, self.colors['text_primary'])
-        text_rect = text_surface.get_rect(center=(shield_pos[0] + self.bar_width//2, shield_pos[1] + self.bar_height//2))
-        screen.blit(text_surface, text_rect)
+        shield_values = (int(player_ship.current_shield), int(player_ship.max_shield))
+        self._queue_bar_widget('shield', self.c_shield_bg,
+                               shield_fill_width, self.c_shield_bar, "Shield: {}J / {}J", shield_values,
+                               self.c_text_primary)
         
         # Cannon heat (if ship has universal cannon)
-        if hasattr(player_ship, 'universal_cannon'):
+        if self._ship_has_cannon:
             self._draw_cannon_heat_bar(screen, player_ship.universal_cannon)
     
     def _draw_cannon_heat_bar(self, screen, cannon):
         """Draw cannon heat/overheat bar"""
-        heat_pos = self.positions['cannon_heat']
         heat_ratio = cannon.get_heat_percentage()
-        
-        # Background
-        pygame.draw.rect(screen, self.colors['cannon_heat_bg'],
-                        (heat_pos[0], heat_pos[1], self.bar_width, self.bar_height))
+        overheated = cannon.is_overheated()
         
         # Heat fill
         heat_fill_width = int(self.bar_width * heat_ratio)
-        if heat_fill_width > 0:
-            heat_color = self.colors['cannon_heat']
-            if heat_ratio > 0.8:
-                heat_color = (255, int(200 * (1.0 - heat_ratio)), 50)
-            
-            pygame.draw.rect(screen, heat_color,
-                            (heat_pos[0], heat_pos[1], heat_fill_width, self.bar_height))
+        heat_color = self.c_cannon_heat
+        if heat_ratio > 0.8:
+            step = int((heat_ratio - 0.8) * 5 * self._heat_hot_steps)
+            heat_color = self._heat_hot_table[step if step < self._heat_hot_steps else self._heat_hot_steps - 1]
         
         # Heat text
-        heat_text = "OVERHEATED!" if cannon.is_overheated() else f"Cannon: {int(heat_ratio * 100)}%"
-        text_color = self.colors['text_danger'] if cannon.is_overheated() else self.colors['text_primary']
-        text_surface = self.font_medium.render(heat_text, True, text_color)
-        text_rect = text_surface.get_rect(center=(heat_pos[0] + self.bar_width//2, heat_pos[1] + self.bar_height//2))
-        screen.blit(text_surface, text_rect)
+        if overheated:
+            heat_fmt, heat_values, text_color = "OVERHEATED!", (), self.c_text_danger
+        else:
+            heat_fmt, heat_values, text_color = "Cannon: {}%", (int(heat_ratio * 100),), self.c_text_primary
+        self._queue_bar_widget('heat', self.c_cannon_heat_bg,
+                               heat_fill_width, heat_color, heat_fmt, heat_values, text_color)
     
     def _draw_physics_info(self, screen, player_ship):
         """Draw inertia physics information"""
         physics_pos = self.positions['physics_info']
         
         # Get physics data
-        if hasattr(player_ship, 'get_velocity'):
+        if self._ship_has_velocity:
             vx, vy = player_ship.get_velocity()
-            velocity_magnitude = math.hypot(vx, vy)
+            velocity_magnitude = (vx * vx + vy * vy) ** 0.5
             kinetic_energy = player_ship.get_kinetic_energy()
             
-            # Velocity display
-            velocity_text = f"Velocity: {velocity_magnitude:.1f} m/s"
-            velocity_surface = self.font_small.render(velocity_text, True, self.colors['velocity_indicator'])
-            screen.blit(velocity_surface, physics_pos)
+            # Velocity display, keyed in tenths of m/s
+            velocity_tenths = int(velocity_magnitude * 10 + 0.5)
+            self._queue_text_line('velocity', self.font_small, "{:.1f} m/s", (velocity_tenths / 10,),
+                                  self.c_velocity_indicator, physics_pos, label="Velocity: ")
             
-            # Kinetic energy display
-            energy_text = f"Kinetic: {kinetic_energy:.0f} J"
-            energy_surface = self.font_small.render(energy_text, True, self.colors['physics_debug'])
-            screen.blit(energy_surface, (physics_pos[0], physics_pos[1] + 20))
+            # Kinetic energy display, keyed in whole joules
+            self._queue_text_line('kinetic', self.font_small, "{} J", (int(kinetic_energy + 0.5),),
+                                  self.c_physics_debug, self.positions['kinetic_info'], label="Kinetic: ")
             
             # Mass display
-            mass_text = f"Mass: {player_ship.mass:.0f} kg"
-            mass_surface = self.font_small.render(mass_text, True, self.colors['text_secondary'])
-            screen.blit(mass_surface, (physics_pos[0], physics_pos[1] + 40))
+            self._queue_text_line('mass', self.font_small, "Mass: {} kg", (int(player_ship.mass + 0.5),),
+                                  self.c_text_secondary, self.positions['mass_info'])
     
     def _draw_wave_info(self, screen, current_wave, enemy_manager):
         """Draw wave information with scaling info"""
@@ -213,29 +368,28 @@ class HUDRenderer:
         
         # Wave number
         wave_text = f"Wave {current_wave}"
-        wave_surface = self.font_large.render(wave_text, True, self.colors['text_primary'])
-        screen.blit(wave_surface, wave_pos)
+        wave_surface = self._render_cached(self.font_large, wave_text, self.c_text_primary)
+        self._blit_queue.append((wave_surface, wave_pos))
         
         # Enemy count with scale info
         enemy_pos = self.positions['enemy_count']
         if enemy_manager:
-            debug_info = enemy_manager.debug_info()
-            enemies_text = f"Enemies: {debug_info['enemies_active']}"
-            if debug_info['enemies_to_spawn'] > 0:
-                enemies_text += f" (+{debug_info['enemies_to_spawn']})"
-            
-            enemies_surface = self.font_medium.render(enemies_text, True, self.colors['text_secondary'])
-            screen.blit(enemies_surface, enemy_pos)
+            # Published in place by the manager: active, to spawn, killed this wave
+            active, to_spawn, killed = enemy_manager.debug_arr[:3].tolist()
+            if to_spawn > 0:
+                self._queue_text_line('enemies', self.font_medium, "Enemies: {} (+{})", (active, to_spawn),
+                                      self.c_text_secondary, enemy_pos)
+            else:
+                self._queue_text_line('enemies', self.font_medium, "Enemies: {}", (active,),
+                                      self.c_text_secondary, enemy_pos)
             
             # Kills this wave
-            kills_text = f"Kills: {debug_info['enemies_killed_this_wave']}"
-            kills_surface = self.font_medium.render(kills_text, True, self.colors['text_secondary'])
-            screen.blit(kills_surface, (enemy_pos[0], enemy_pos[1] + 30))
+            self._queue_text_line('kills', self.font_medium, "Kills: {}", (killed,),
+                                  self.c_text_secondary, self.positions['kills_info'])
             
             # Scale factor display
-            scale_text = f"Scale: {debug_info['scale_factor']:.1%}"
-            scale_surface = self.font_small.render(scale_text, True, self.colors['text_secondary'])
-            screen.blit(scale_surface, (enemy_pos[0], enemy_pos[1] + 55))
+            self._queue_text_line('enemy_scale', self.font_small, "Scale: {:.1%}", (enemy_manager.scale_factor,),
+                                  self.c_text_secondary, self.positions['enemy_scale_info'])
     
     def _draw_weapon_info(self, screen, player_ship):
         """Draw weapon cooldown and ability info"""
@@ -243,54 +397,80 @@ class HUDRenderer:
         
         # Ship type
         ship_text = f"Ship: {player_ship.ship_type}"
-        ship_surface = self.font_medium.render(ship_text, True, self.colors['text_primary'])
-        screen.blit(ship_surface, weapon_pos)
+        ship_surface = self._render_cached(self.font_medium, ship_text, self.c_text_primary)
+        self._blit_queue.append((ship_surface, weapon_pos))
         
         # Weapon cooldowns
-        if hasattr(player_ship, 'cooldowns'):
-            y_offset = 30
-            for weapon, cooldown_time in player_ship.cooldowns.items():
+        y_offset = 30
+        if self._ship_has_cooldowns and not any(cooldown_time > 0 for cooldown_time in player_ship.cooldowns.values()):
+            # Idle: every row reads READY, so reuse the last all-ready rows while the weapon set is unchanged
+            cooldowns = player_ship.cooldowns
+            if self._ready_rows[0] != tuple(cooldowns):
+                self._ready_rows = (tuple(cooldowns), self._build_ready_rows(cooldowns))
+            self._blit_queue.extend(self._ready_rows[1])
+            y_offset += 20 * len(cooldowns)
+        elif self._ship_has_cooldowns:
+            label_cache = self._weapon_label_cache
+            row_positions = self._weapon_row_positions
+            c_warn = self.c_text_warning
+            c_sec = self.c_text_secondary
+            render = self._render_cached
+            font = self.font_small
+            queue = self._blit_queue
+            for row, (weapon, cooldown_time) in enumerate(player_ship.cooldowns.items()):
+                if row == len(row_positions):
+                    row_positions.append((weapon_pos[0], weapon_pos[1] + y_offset))
+                labels = label_cache.get(weapon)
+                if labels is None:
+                    label = weapon.replace('_', ' ').title()
+                    labels = label_cache[weapon] = (f"{label}: ", f"{label}: READY")
+                
                 if cooldown_time > 0:
-                    cooldown_text = f"{weapon.replace('_', ' ').title()}: {cooldown_time:.1f}s"
-                    color = self.colors['text_warning']
+                    queue.extend(self._labeled_value_blits(font, labels[0], f"{cooldown_time:.1f}s", c_warn,
+                                                           row_positions[row]))
                 else:
-                    cooldown_text = f"{weapon.replace('_', ' ').title()}: READY"
-                    color = self.colors['text_secondary']
-                
-                cooldown_surface = self.font_small.render(cooldown_text, True, color)
-                screen.blit(cooldown_surface, (weapon_pos[0], weapon_pos[1] + y_offset))
+                    queue.append((render(font, labels[1], c_sec), row_positions[row]))
                 y_offset += 20
         
         # Special status effects
-        if hasattr(player_ship, 'overcharge_active') and player_ship.overcharge_active:
-            overcharge_text = f"OVERCHARGED: {player_ship.overcharge_timer:.1f}s"
-            overcharge_surface = self.font_medium.render(overcharge_text, True, (255, 255, 0))
-            screen.blit(overcharge_surface, (weapon_pos[0], weapon_pos[1] + y_offset))
+        if self._ship_has_overcharge and player_ship.overcharge_active:
+            self._blit_queue.extend(self._labeled_value_blits(self.font_medium, "OVERCHARGED: ",
+                                                              f"{player_ship.overcharge_timer:.1f}s", (255, 255, 0),
+                                                              (weapon_pos[0], weapon_pos[1] + y_offset)))
+    
+    def _build_ready_rows(self, cooldowns):
+        """Build the cooldown row blits for a weapon set with every weapon ready"""
+        weapon_pos = self.positions['weapon_info']
+        rows = []
+        for row, weapon in enumerate(cooldowns):
+            label = self._weapon_label_cache.get(weapon)
+            if label is None:
+                title = weapon.replace('_', ' ').title()
+                label = self._weapon_label_cache[weapon] = (f"{title}: ", f"{title}: READY")
+            surface = self._render_cached(self.font_small, label[1], self.c_text_secondary)
+            rows.append((surface, (weapon_pos[0], weapon_pos[1] + 30 + row * 20)))
+        return rows
     
     def _draw_performance_info(self, screen, projectile_manager):
         """Draw performance information with joule damage tracking"""
         perf_pos = self.positions['system_info']
         
-        # Projectile count
-        proj_count = projectile_manager.get_projectile_count()
-        proj_text = f"Projectiles: {proj_count}"
-        proj_surface = self.font_small.render(proj_text, True, self.colors['text_secondary'])
-        screen.blit(proj_surface, perf_pos)
+        # Projectile count, re-rendered only when it changes
+        self._queue_text_line('projectiles', self.font_small, "Projectiles: {}",
+                              (projectile_manager.projectile_count,), self.c_text_secondary, perf_pos)
         
-        # Scale information
-        scale_text = f"Scale: {self.scale_factor:.1%}"
-        scale_surface = self.font_small.render(scale_text, True, self.colors['text_secondary'])
-        screen.blit(scale_surface, (perf_pos[0], perf_pos[1] + 20))
+        # Scale information never changes
+        self._queue_text_line('system_scale', self.font_small, "Scale: {:.1%}", (self.scale_factor,),
+                              self.c_text_secondary, self.positions['system_scale_info'])
     
     def _draw_damage_indicator(self, screen):
         """Draw red flash when player takes damage"""
         alpha = int(100 * (self.damage_flash_timer / 0.5))
-        damage_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        damage_surface.fill((255, 0, 0, alpha))
-        screen.blit(damage_surface, (0, 0))
+        self._damage_flash_surface.set_alpha(alpha)
+        self._blit_queue.append((self._damage_flash_surface, (0, 0)))
     
-    def draw_controls_help(self, screen):
-        """Draw control hints with inertia physics information"""
+    def _build_controls_help(self):
+        """Pre-render the controls help panel with its text"""
         controls = [
             "Controls:",
             "Arrow Keys - Thrust (Inertia)",
@@ -307,28 +487,39 @@ class HUDRenderer:
             "0.6% screen scaling"
         ]
         
-        # Background panel - scaled
-        panel_width = max(150, int(200 * (self.base_size / 13)))
-        panel_height = len(controls) * max(12, int(25 * (self.base_size / 13))) + 20
-        panel_x = self.screen_width - panel_width - self.margin
-        panel_y = self.screen_height // 2 - panel_height // 2
-        
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel_surface.fill(self.colors['hud_bg'])
-        screen.blit(panel_surface, (panel_x, panel_y))
+        line_height = self._line_height_controls
+        panel_width = self._panel_w_controls
+        panel_height = len(controls) * line_height + 20
         
-        # Control text
-        line_height = max(12, int(25 * (self.base_size / 13)))
+        lines = []
         for i, control in enumerate(controls):
             if control == "":
                 continue
             elif control in ["Controls:", "Physics:"]:
-                color = self.colors['text_warning']
+                color = self.c_text_warning
             else:
-                color = self.colors['text_secondary']
-            
-            control_surface = self.font_small.render(control, True, color)
-            screen.blit(control_surface, (panel_x + 10, panel_y + 10 + i * line_height))
+                color = self.c_text_secondary
+            lines.append((self.font_small.render(control, True, color), (10, 10 + i * line_height)))
+        
+        # Composited premultiplied so one blit matches drawing the panel and then each line on screen.
+        # Wide enough for any line that runs past the panel, which stays transparent outside the background
+        surface_width = max([panel_width] + [pos[0] + text.get_width() for text, pos in lines])
+        surface = pygame.Surface((surface_width, panel_height), pygame.SRCALPHA)
+        surface.fill(self.c_hud_bg, (0, 0, panel_width, panel_height))
+        surface = surface.premul_alpha()
+        for text, pos in lines:
+            # convert_alpha() first: premul_alpha() misreads the padded rows of font surfaces
+            surface.blit(text.convert_alpha().premul_alpha(), pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+        
+        self._controls_help_surface = surface.convert_alpha()
+        self._controls_help_pos = (self.screen_width - panel_width - self.margin,
+                                   self.screen_height // 2 - panel_height // 2)
+    
+    def draw_controls_help(self, screen):
+        """Draw control hints with inertia physics information"""
+        if self._controls_help_surface is None:
+            self._build_controls_help()
+        screen.blit(self._controls_help_surface, self._controls_help_pos, special_flags=pygame.BLEND_PREMULTIPLIED)
     
     def trigger_damage_flash(self):
         """Trigger damage indicator flash"""
@@ -336,15 +527,24 @@ class HUDRenderer:
     
     def draw_game_over(self, screen, final_wave, total_kills, survival_time):
         """Draw game over screen"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        key = (final_wave, total_kills, round(survival_time, 1))
+        if key != self._game_over_key:
+            self._game_over_blits = self._build_game_over(final_wave, total_kills, key[2])
+            self._game_over_key = key
+        
+        screen.blits(self._game_over_blits, False)
+    
+    def _build_game_over(self, final_wave, total_kills, survival_time):
+        """Render the game over overlay and texts into a list of blits"""
+        # Semi-transparent overlay, allocated once
+        if self._game_over_overlay is None:
+            self._game_over_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            self._game_over_overlay.fill((0, 0, 0, 180))
+        blits = [(self._game_over_overlay, (0, 0))]
         
         # Game Over text
-        game_over_text = self.font_large.render("GAME OVER", True, self.colors['text_danger'])
-        game_over_rect = game_over_text.get_rect(center=(self.screen_width//2, self.screen_height//2 - 100))
-        screen.blit(game_over_text, game_over_rect)
+        game_over_text = self._render_cached(self.font_large, "GAME OVER", self.c_text_danger)
+        blits.append((game_over_text, self._centered(game_over_text, self.positions['game_over_title'])))
         
         # Stats
         stats = [
@@ -355,37 +555,45 @@ class HUDRenderer:
             f"Scale: {self.scale_factor:.1%} screen scaling"
         ]
         
+        stats_x, stats_y = self.positions['game_over_stats']
         for i, stat in enumerate(stats):
-            stat_surface = self.font_medium.render(stat, True, self.colors['text_primary'])
-            stat_rect = stat_surface.get_rect(center=(self.screen_width//2, self.screen_height//2 - 20 + i * 40))
-            screen.blit(stat_surface, stat_rect)
+            stat_surface = self._render_cached(self.font_medium, stat, self.c_text_primary)
+            blits.append((stat_surface, self._centered(stat_surface, (stats_x, stats_y + i * 40))))
         
         # Restart hint
-        restart_text = self.font_medium.render("Press ESC to return to menu", True, self.colors['text_secondary'])
-        restart_rect = restart_text.get_rect(center=(self.screen_width//2, self.screen_height//2 + 150))
-        screen.blit(restart_text, restart_rect)
+        restart_text = self._render_cached(self.font_medium, "Press ESC to return to menu", self.c_text_secondary)
+        blits.append((restart_text, self._centered(restart_text, self.positions['game_over_restart'])))
+        
+        return blits
     
     def draw_wave_complete(self, screen, wave_number, next_wave_timer):
         """Draw wave completion notification"""
+        key = (wave_number, round(next_wave_timer, 1))
+        if key != self._wave_complete_key:
+            self._build_wave_complete(wave_number, key[1])
+            self._wave_complete_key = key
+        
+        screen.blit(self._wave_complete_surface, self._wave_complete_pos)
+    
+    def _build_wave_complete(self, wave_number, next_wave_timer):
+        """Composite the wave complete panel with its texts"""
         # Background panel - scaled
-        panel_width = max(200, int(400 * (self.base_size / 13)))
-        panel_height = max(50, int(100 * (self.base_size / 13)))
-        panel_x = self.screen_width//2 - panel_width//2
-        panel_y = self.screen_height//2 - panel_height//2
+        panel_width = self._panel_w_wave_complete
+        panel_height = self._panel_h_wave_complete
         
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        panel_surface.fill(self.colors['hud_bg'])
-        pygame.draw.rect(panel_surface, self.colors['text_primary'], (0, 0, panel_width, panel_height), 2)
-        screen.blit(panel_surface, (panel_x, panel_y))
+        panel_surface = self._wave_complete_surface
+        if panel_surface is None:
+            panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            self._wave_complete_surface = panel_surface
+        panel_surface.fill(self.c_hud_bg)
+        pygame.draw.rect(panel_surface, self.c_text_primary, (0, 0, panel_width, panel_height), 2)
         
         # Wave complete text
         wave_text = f"Wave {wave_number} Complete!"
-        wave_surface = self.font_large.render(wave_text, True, self.colors['text_primary'])
-        wave_rect = wave_surface.get_rect(center=(panel_width//2, panel_height//3))
-        panel_surface.blit(wave_surface, wave_rect)
+        wave_surface = self._render_cached(self.font_large, wave_text, self.c_text_primary)
+        panel_surface.blit(wave_surface, self._centered(wave_surface, self.positions['wave_complete_title']))
         
         # Next wave timer
         timer_text = f"Next wave in {next_wave_timer:.1f}s"
-        timer_surface = self.font_medium.render(timer_text, True, self.colors['text_secondary'])
-        timer_rect = timer_surface.get_rect(center=(panel_width//2, panel_height*2//3))
-        panel_surface.blit(timer_surface, timer_rect)
\ No newline at end of file
+        timer_surface = self.font_medium.render(timer_text, True, self.c_text_secondary)
+        panel_surface.blit(timer_surface, self._centered(timer_surface, self.positions['wave_complete_timer']))
\ No newline at end of file
@@ -4,6 +4,7 @@ import math
 import random
 from ship_base import ShipBase
 from weapons_database import WeaponsDatabase
+from damage_calculator import DamageCalculator
 
 class BreacherShip(ShipBase):
     """Explosive specialist ship with stat-based progression"""
@@ -161,7 +162,7 @@ class BreacherShip(ShipBase):
             -math.pi / 2 + math.pi / 12
         ]
         
-        velocity_ms = enhanced_bomb_stats["velocity_kmh"] * 1000 / 3600
+        velocity_ms = enhanced_bomb_stats["velocity_kmh"] * DamageCalculator.KMH_TO_MS
         group_id = self._generate_group_id()
         
         for angle in angles:
@@ -203,7 +204,7 @@ class BreacherShip(ShipBase):
         cluster_stats["max_damage"] = int(cluster_stats["max_damage"] * 0.75)
         cluster_stats["velocity_kmh"] = int(cluster_stats["velocity_kmh"] * 1.2)
         
-        velocity_ms = cluster_stats["velocity_kmh"] * 1000 / 3600
+        velocity_ms = cluster_stats["velocity_kmh"] * DamageCalculator.KMH_TO_MS
         group_id = self._generate_group_id()
         
         # 7 bombs in line formation
@@ -1,17 +1,74 @@
 #!/usr/bin/env python3
 import pygame
+import logging
 import math
 import random
+import numpy as np
+from dataclasses import dataclass
+from itertools import compress
 from damage_calculator import DamageCalculator
 
+log = logging.getLogger(__name__)
+
+def _beam_hits(start_x, start_y, end_x, end_y, width, enemy_x, enemy_y):
+    """Beams x enemies matrix of whether each enemy is closer than the beam width to the beam segment"""
+    dx = (end_x - start_x)[:, None]
+    dy = (end_y - start_y)[:, None]
+    px = enemy_x - start_x[:, None]
+    py = enemy_y - start_y[:, None]
+    
+    # Projection onto each segment, clamped to its ends; zero-length beams keep t = 0 (the start point)
+    length_sq = dx * dx + dy * dy
+    t = np.zeros(px.shape)
+    np.divide(px * dx + py * dy, length_sq, out=t, where=length_sq > 0)
+    np.clip(t, 0.0, 1.0, out=t)
+    
+    offset_x = px - t * dx
+    offset_y = py - t * dy
+    return offset_x * offset_x + offset_y * offset_y < (width * width)[:, None]
+
+@dataclass(slots=True)
+class EnergyBeam:
+    """Energy beam segment and its remaining firing time"""
+    start_x: float
+    start_y: float
+    end_x: float
+    end_y: float
+    weapon_data: dict
+    remaining_duration: float
+    width: int
+    joule_damage: float
+    active: bool = True
+    projectile_type: str = "energy"
+
 class ProjectileManager:
     """Projectile manager with pure joule damage and 0.6% screen scaling"""
     
+    # Bombs and kinetic shots live in pools of parallel arrays, grown by doubling;
+    # the first bomb_count/shot_count entries are live, the tail is spare capacity
+    PROJECTILE_POOL_CAPACITY = 64
+    FRIENDLY_FIRE_MULT = 0.1  # Fraction of a bomb's damage the player takes from their own blast
+    BOMB_POOL_FIELDS = (("bomb_x", np.float64), ("bomb_y", np.float64),
+                        ("bomb_vx", np.float64), ("bomb_vy", np.float64),
+                        ("bomb_lifetime", np.float64), ("bomb_active", np.bool_))
+    SHOT_POOL_FIELDS = (("shot_x", np.float64), ("shot_y", np.float64),
+                        ("shot_vx", np.float64), ("shot_vy", np.float64),
+                        ("shot_lifetime", np.float64), ("shot_active", np.bool_),
+                        ("shot_joule_damage", np.float64), ("shot_is_player", np.bool_))
+    
     def __init__(self, screen_width, screen_height):
-        # Active projectiles
-        self.bombs = []
-        self.kinetic_shots = []
+        # Active projectiles; per-bomb warhead records and per-shot data stay in lists indexed by slot
+        self.bomb_count = 0
+        self.shot_count = 0
+        for name, dtype in self.BOMB_POOL_FIELDS + self.SHOT_POOL_FIELDS:
+            setattr(self, name, np.empty(self.PROJECTILE_POOL_CAPACITY, dtype=dtype))
+        self.bomb_warhead_data = []
+        self.bomb_stats = []
+        self.bomb_group_id = []
+        self.shot_projectile_data = []
         self.energy_beams = []
+        self._beams_expired = False  # Set when a beam runs out, so cleanup only then rewrites the list
+        self._beam_surface = None  # Screen-sized scratch layer for translucent beams, created on first use
         
         # Screen boundaries for cleanup
         self.screen_width = screen_width
@@ -22,156 +79,192 @@ class ProjectileManager:
         self.scale_factor = 0.006
         self.base_size = min(screen_width, screen_height) * self.scale_factor
         
+        # Scaled sizes shared by every projectile of a kind
+        self.bomb_radius = max(4, int(self.base_size * 0.6))  # Scaled bomb visual size
+        self.bomb_proximity_radius = max(15, int(self.base_size * 1.8))  # Scaled proximity fuse
+        self.shot_radius = max(2, int(self.base_size * 0.15))  # Scaled shot visual size
+        
         # Reference to other systems
         self.effect_manager = None
         
+        # Active projectile count, kept current by add_*/cleanup for the per-frame HUD read
+        self.projectile_count = 0
+        
         print(f"ProjectileManager: Scale={self.scale_factor:.3f}, Base size={self.base_size:.1f}px")
     
     def set_effect_manager(self, effect_manager):
         """Set reference to effect manager for visual effects"""
         self.effect_manager = effect_manager
     
+    def _reserve_slot(self, fields, count):
+        """Make room for one more entry in a projectile pool, doubling its capacity as needed"""
+        capacity = len(getattr(self, fields[0][0]))
+        if count < capacity:
+            return
+        
+        for name, dtype in fields:
+            grown = np.empty(capacity * 2, dtype=dtype)
+            grown[:count] = getattr(self, name)[:count]
+            setattr(self, name, grown)
+    
     def add_bomb(self, x, y, vx, vy, bomb_stats, group_id):
-        """Add bomb projectile with pure joule damage"""
-        # Convert bomb stats to warhead data for damage calculator
+        """Add bomb projectile with pure joule damage; returns True once queued"""
+        # Convert bomb stats to a warhead record for damage calculator
         warhead_data = DamageCalculator.create_warhead_data_from_db(bomb_stats)
         
-        bomb = {
-            "x": x,
-            "y": y,
-            "vx": vx,
-            "vy": vy,
-            "warhead_data": warhead_data,
-            "bomb_stats": bomb_stats,
-            "group_id": group_id,
-            "active": True,
-            "lifetime": 10.0,
-            "projectile_type": "bomb",
-            "radius": max(4, int(self.base_size * 0.6)),  # Scaled bomb visual size
-            "proximity_radius": max(15, int(self.base_size * 1.8))  # Scaled proximity fuse
-        }
-        
-        self.bombs.append(bomb)
-        print(f"Added bomb: {warhead_data['explosive_kg']:.1f}kg explosive, {warhead_data['shrapnel_kg']:.1f}kg shrapnel")
-        return bomb
+        slot = self.bomb_count
+        self._reserve_slot(self.BOMB_POOL_FIELDS, slot)
+        self.bomb_x[slot] = x
+        self.bomb_y[slot] = y
+        self.bomb_vx[slot] = vx
+        self.bomb_vy[slot] = vy
+        self.bomb_lifetime[slot] = 10.0
+        self.bomb_active[slot] = True
+        self.bomb_warhead_data.append(warhead_data)
+        self.bomb_stats.append(bomb_stats)
+        self.bomb_group_id.append(group_id)
+        self.bomb_count = slot + 1
+        
+        self.projectile_count += 1
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Added bomb: %.1fkg explosive, %.1fkg shrapnel", warhead_data.explosive_kg, warhead_data.shrapnel_kg)
+        return True
     
     def add_kinetic_shot(self, x, y, vx, vy, projectile_data, is_player_shot=True):
-        """Add kinetic projectile with pure joule damage"""
-        shot = {
-            "x": x,
-            "y": y,
-            "vx": vx,
-            "vy": vy,
-            "projectile_data": projectile_data,
-            "is_player_shot": is_player_shot,
-            "active": True,
-            "lifetime": 5.0,
-            "projectile_type": "kinetic",
-            "radius": max(2, int(self.base_size * 0.15))  # Scaled shot visual size
-        }
-        
+        """Add kinetic projectile with pure joule damage; returns True once queued"""
         # Calculate and store pure joule damage
-        shot["joule_damage"] = DamageCalculator.calculate_projectile_damage(projectile_data)
-        
-        self.kinetic_shots.append(shot)
-        if is_player_shot:
-            print(f"Player shot: {shot['joule_damage']:.0f} J kinetic energy")
-        else:
-            print(f"Enemy shot: {shot['joule_damage']:.0f} J kinetic energy")
-        return shot
+        joule_damage = DamageCalculator.calculate_projectile_damage(projectile_data)
+        
+        slot = self.shot_count
+        self._reserve_slot(self.SHOT_POOL_FIELDS, slot)
+        self.shot_x[slot] = x
+        self.shot_y[slot] = y
+        self.shot_vx[slot] = vx
+        self.shot_vy[slot] = vy
+        self.shot_lifetime[slot] = 5.0
+        self.shot_active[slot] = True
+        self.shot_joule_damage[slot] = joule_damage
+        self.shot_is_player[slot] = is_player_shot
+        self.shot_projectile_data.append(projectile_data)
+        self.shot_count = slot + 1
+        
+        self.projectile_count += 1
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s shot: %.0f J kinetic energy", "Player" if is_player_shot else "Enemy", joule_damage)
+        return True
     
     def add_energy_beam(self, x, y, target_x, target_y, weapon_data, duration):
-        """Add energy beam with pure joule damage"""
-        beam = {
-            "start_x": x,
-            "start_y": y,
-            "end_x": target_x,
-            "end_y": target_y,
-            "weapon_data": weapon_data,
-            "remaining_duration": duration,
-            "active": True,
-            "projectile_type": "energy",
-            "width": max(3, int(self.base_size * 0.25))  # Scaled beam width
-        }
-        
+        """Add energy beam with pure joule damage; returns True once queued"""
         # Calculate pure joule damage for this beam
-        beam["joule_damage"] = DamageCalculator.calculate_energy_weapon_damage(
+        joule_damage = DamageCalculator.calculate_energy_weapon_damage(
             weapon_data, (target_x, target_y), (x, y)
         )
         
+        beam = EnergyBeam(
+            start_x=x,
+            start_y=y,
+            end_x=target_x,
+            end_y=target_y,
+            weapon_data=weapon_data,
+            remaining_duration=duration,
+            width=max(3, int(self.base_size * 0.25)),  # Scaled beam width
+            joule_damage=joule_damage
+        )
+        
         self.energy_beams.append(beam)
-        print(f"Energy beam: {beam['joule_damage']:.0f} J energy pulse")
-        return beam
+        self.projectile_count += 1
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Energy beam: %.0f J energy pulse", beam.joule_damage)
+        return True
     
     def update(self, delta_time, enemies, player_ship):
         """Update all projectiles and handle collisions with pure joule damage"""
-        self._update_bombs(delta_time, enemies, player_ship)
-        self._update_kinetic_shots(delta_time, enemies, player_ship)
-        self._update_energy_beams(delta_time, enemies, player_ship)
+        if self.projectile_count == 0:
+            return
+        
+        # One snapshot of the living enemies for every projectile kind this frame. enemies holds enemy
+        # objects only (EnemyManager.living_enemies), so x/y/radius need no guards; positions do not
+        # change during the update, but enemies can die in it, so hits still check alive
+        targets = [enemy for enemy in enemies if enemy.alive]
+        target_count = len(targets)
+        snapshot = (targets,
+                    np.fromiter((enemy.x for enemy in targets), dtype=np.float64, count=target_count),
+                    np.fromiter((enemy.y for enemy in targets), dtype=np.float64, count=target_count),
+                    np.fromiter((enemy.radius for enemy in targets), dtype=np.float64, count=target_count))
+        
+        self._update_bombs(delta_time, snapshot, player_ship)
+        self._update_kinetic_shots(delta_time, snapshot, player_ship)
+        self._update_energy_beams(delta_time, snapshot, player_ship)
         self._cleanup_projectiles()
     
-    def _update_bombs(self, delta_time, enemies, player_ship):
+    def _update_bombs(self, delta_time, snapshot, player_ship):
         """Update bomb projectiles with proximity fusing"""
-        for bomb in self.bombs[:]:
-            if not bomb["active"]:
-                continue
-            
-            # Update position
-            bomb["x"] += bomb["vx"] * delta_time
-            bomb["y"] += bomb["vy"] * delta_time
-            bomb["lifetime"] -= delta_time
-            
-            # Auto-destruct if lifetime exceeded
-            if bomb["lifetime"] <= 0:
-                bomb["active"] = False
-                continue
-            
+        count = self.bomb_count
+        if count == 0:
+            return
+        
+        # Update every position at once
+        x = self.bomb_x[:count]
+        y = self.bomb_y[:count]
+        vx = self.bomb_vx[:count]
+        vy = self.bomb_vy[:count]
+        lifetime = self.bomb_lifetime[:count]
+        active = self.bomb_active[:count]
+        x += vx * delta_time
+        y += vy * delta_time
+        lifetime -= delta_time
+        
+        # Auto-destruct if lifetime exceeded
+        active &= lifetime > 0
+        
+        # Fuses are checked bomb by bomb: each detonation can kill enemies the next bomb would see
+        targets, enemy_x, enemy_y, _ = snapshot
+        enemy_positions = list(zip(enemy_x.tolist(), enemy_y.tolist()))
+        xs, ys, vxs, vys = x.tolist(), y.tolist(), vx.tolist(), vy.tolist()
+        for slot in np.flatnonzero(active).tolist():
             # Check proximity fuse against living enemies
-            enemy_positions = [(enemy.x, enemy.y) for enemy in enemies if hasattr(enemy, 'x') and enemy.alive]
             should_trigger, closest_target = DamageCalculator.check_proximity_trigger(
-                (bomb["x"], bomb["y"]),
-                (bomb["vx"], bomb["vy"]),
+                (xs[slot], ys[slot]),
+                (vxs[slot], vys[slot]),
                 enemy_positions,
-                fuse_radius=bomb["proximity_radius"],
+                fuse_radius=self.bomb_proximity_radius,
                 delta_time=delta_time
             )
             
             if should_trigger:
-                self._detonate_bomb(bomb, enemies, player_ship)
-                bomb["active"] = False
+                self._detonate_bomb(xs[slot], ys[slot], self.bomb_warhead_data[slot], targets, player_ship)
+                active[slot] = False
+                enemy_positions = [(enemy.x, enemy.y) for enemy in targets if enemy.alive]
     
-    def _detonate_bomb(self, bomb, enemies, player_ship):
+    def _detonate_bomb(self, bomb_x, bomb_y, warhead_data, targets, player_ship):
         """Handle bomb detonation with PURE JOULE DAMAGE"""
-        explosion_center = (bomb["x"], bomb["y"])
+        explosion_center = (bomb_x, bomb_y)
         
-        print(f"BOMB DETONATION: {bomb['warhead_data']['explosive_kg']:.1f}kg explosive at ({bomb['x']:.0f}, {bomb['y']:.0f})")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("BOMB DETONATION: %.1fkg explosive at (%.0f, %.0f)", warhead_data.explosive_kg, bomb_x, bomb_y)
         
         # Create explosion visual effect - scaled
         if self.effect_manager:
-            explosion_size = self._calculate_explosion_size(bomb["warhead_data"])
+            explosion_size = self._calculate_explosion_size(warhead_data)
             self.effect_manager.add_explosion(
-                bomb["x"], bomb["y"], 
+                bomb_x, bomb_y, 
                 size=explosion_size * (self.base_size / 13), 
                 duration=1.0
             )
         
-        # Apply PURE JOULE damage to each living enemy
-        for enemy in enemies[:]:
-            if not hasattr(enemy, 'x') or not hasattr(enemy, 'y') or not enemy.alive:
-                continue
-            
-            target_pos = (enemy.x, enemy.y)
-            distance = DamageCalculator.calculate_distance(explosion_center, target_pos)
-            
-            # Calculate PURE JOULE damage - no scaling factors
-            damage_joules = DamageCalculator.calculate_explosion_damage(
-                explosion_center,
-                target_pos,
-                bomb["warhead_data"]
-            )
-            
+        # Apply PURE JOULE damage to each living enemy in one batched calculation
+        targets = [enemy for enemy in targets if enemy.alive]
+        damages = DamageCalculator.calculate_explosion_damage_batch(
+            explosion_center,
+            [(enemy.x, enemy.y) for enemy in targets],
+            warhead_data
+        )
+        
+        for enemy, damage_joules in zip(targets, damages):
             if damage_joules > 0:
-                print(f"Enemy at {distance:.0f}px takes {damage_joules:.0f} J explosive damage")
+                if log.isEnabledFor(logging.DEBUG):
+                    distance = DamageCalculator.calculate_distance(explosion_center, (enemy.x, enemy.y))
+                    log.debug("Enemy at %.0fpx takes %.0f J explosive damage", distance, damage_joules)
                 
                 # Apply PURE JOULE damage
                 was_killed = enemy.take_damage(damage_joules, "explosive")
@@ -185,191 +278,235 @@ class ProjectileManager:
         # Check player friendly fire with PURE JOULE damage
         if player_ship:
             player_pos = (player_ship.x, player_ship.y)
-            player_distance = DamageCalculator.calculate_distance(explosion_center, player_pos)
-            
             player_damage_joules = DamageCalculator.calculate_explosion_damage(
                 explosion_center,
                 player_pos,
-                bomb["warhead_data"]
+                warhead_data
             )
             
             if player_damage_joules > 0:
-                # Reduced friendly fire (10%)
-                friendly_fire_joules = player_damage_joules * 0.1
-                print(f"Player takes {friendly_fire_joules:.0f} J friendly fire at {player_distance:.0f}px")
+                # Reduced friendly fire
+                friendly_fire_joules = player_damage_joules * self.FRIENDLY_FIRE_MULT
+                if log.isEnabledFor(logging.DEBUG):
+                    player_distance = DamageCalculator.calculate_distance(explosion_center, player_pos)
+                    log.debug("Player takes %.0f J friendly fire at %.0fpx", friendly_fire_joules, player_distance)
                 player_ship.take_damage(friendly_fire_joules, "explosive")
     
-    def _update_kinetic_shots(self, delta_time, enemies, player_ship):
+    def _update_kinetic_shots(self, delta_time, snapshot, player_ship):
         """Update kinetic projectiles with PURE JOULE damage"""
-        for shot in self.kinetic_shots[:]:
-            if not shot["active"]:
-                continue
-            
-            # Update position
-            shot["x"] += shot["vx"] * delta_time
-            shot["y"] += shot["vy"] * delta_time
-            shot["lifetime"] -= delta_time
-            
-            if shot["lifetime"] <= 0:
-                shot["active"] = False
-                continue
+        count = self.shot_count
+        if count == 0:
+            return
+        
+        # Update every position at once
+        x = self.shot_x[:count]
+        y = self.shot_y[:count]
+        lifetime = self.shot_lifetime[:count]
+        active = self.shot_active[:count]
+        x += self.shot_vx[:count] * delta_time
+        y += self.shot_vy[:count] * delta_time
+        lifetime -= delta_time
+        active &= lifetime > 0
+        
+        shot_radius = self.shot_radius
+        joule_damages = self.shot_joule_damage[:count]
+        is_player_shot = self.shot_is_player[:count]
+        
+        # Player shots vs enemies - PURE JOULE DAMAGE
+        player_shots = np.flatnonzero(active & is_player_shot)
+        targets, enemy_x, enemy_y, enemy_radius = snapshot
+        if len(player_shots) and targets:
+            # Scaled collision detection for every shot/enemy pair at once
+            dx = x[player_shots, None] - enemy_x
+            dy = y[player_shots, None] - enemy_y
+            collision_distance = shot_radius + enemy_radius
+            in_range = dx * dx + dy * dy < collision_distance * collision_distance
             
-            # Check collisions
-            if shot["is_player_shot"]:
-                # Player shots vs enemies - PURE JOULE DAMAGE
-                for enemy in enemies[:]:
-                    if not hasattr(enemy, 'x') or not hasattr(enemy, 'y') or not enemy.alive:
+            # Each shot hits the first enemy in range that an earlier shot has not already killed
+            hit_rows = np.flatnonzero(in_range.any(axis=1))
+            for slot, row in zip(player_shots[hit_rows].tolist(), in_range[hit_rows]):
+                for target_index in np.flatnonzero(row).tolist():
+                    enemy = targets[target_index]
+                    if not enemy.alive:
                         continue
                     
-                    # Scaled collision detection
-                    collision_distance = shot["radius"] + enemy.radius
-                    distance = math.hypot(shot["x"] - enemy.x, shot["y"] - enemy.y)
+                    # Apply PURE JOULE damage
+                    damage_joules = joule_damages.item(slot)
+                    
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("Player shot hits enemy: %.0f J kinetic damage", damage_joules)
+                    was_killed = enemy.take_damage(damage_joules, "kinetic")
                     
-                    if distance < collision_distance:
-                        # Apply PURE JOULE damage
-                        damage_joules = shot["joule_damage"]
-                        
-                        print(f"Player shot hits enemy: {damage_joules:.0f} J kinetic damage")
-                        was_killed = enemy.take_damage(damage_joules, "kinetic")
-                        
-                        # Visual effects
-                        if self.effect_manager:
-                            self.effect_manager.add_impact_spark(shot["x"], shot["y"])
-                            self.effect_manager.add_floating_text(
-                                enemy.x, enemy.y, f"{damage_joules:.0f}J", was_killed
-                            )
-                        
-                        shot["active"] = False
-                        break
-            else:
-                # Enemy shots vs player - PURE JOULE DAMAGE
-                if player_ship and hasattr(player_ship, 'x') and hasattr(player_ship, 'y'):
-                    collision_distance = shot["radius"] + player_ship.radius
-                    distance = math.hypot(shot["x"] - player_ship.x, shot["y"] - player_ship.y)
+                    # Visual effects
+                    if self.effect_manager:
+                        self.effect_manager.add_impact_spark(x.item(slot), y.item(slot))
+                        self.effect_manager.add_floating_text(
+                            enemy.x, enemy.y, f"{damage_joules:.0f}J", was_killed
+                        )
                     
-                    if distance < collision_distance:
-                        # Apply PURE JOULE damage to player
-                        damage_joules = shot["joule_damage"]
-                        
-                        print(f"Enemy shot hits player: {damage_joules:.0f} J kinetic damage")
-                        player_ship.take_damage(damage_joules, "kinetic")
-                        
-                        # Visual effects
-                        if self.effect_manager:
-                            self.effect_manager.add_impact_spark(shot["x"], shot["y"])
-                            self.effect_manager.add_floating_text(
-                                player_ship.x, player_ship.y, f"-{damage_joules:.0f}J", False
-                            )
-                        
-                        shot["active"] = False
+                    active[slot] = False
+                    break
+        
+        # Enemy shots vs player - PURE JOULE DAMAGE
+        if player_ship and hasattr(player_ship, 'x') and hasattr(player_ship, 'y'):
+            dx = x - player_ship.x
+            dy = y - player_ship.y
+            collision_distance = shot_radius + player_ship.radius
+            hits = active & ~is_player_shot & (dx * dx + dy * dy < collision_distance * collision_distance)
+            for slot in np.flatnonzero(hits).tolist():
+                # Apply PURE JOULE damage to player
+                damage_joules = joule_damages.item(slot)
+                
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Enemy shot hits player: %.0f J kinetic damage", damage_joules)
+                player_ship.take_damage(damage_joules, "kinetic")
+                
+                # Visual effects
+                if self.effect_manager:
+                    self.effect_manager.add_impact_spark(x.item(slot), y.item(slot))
+                    self.effect_manager.add_floating_text(
+                        player_ship.x, player_ship.y, f"-{damage_joules:.0f}J", False
+                    )
+                
+                active[slot] = False
     
-    def _update_energy_beams(self, delta_time, enemies, player_ship):
+    def _update_energy_beams(self, delta_time, snapshot, player_ship):
         """Update energy beam weapons with PURE JOULE damage"""
-        for beam in self.energy_beams[:]:
-            if not beam["active"]:
+        firing_beams = []
+        for beam in self.energy_beams:
+            if not beam.active:
                 continue
             
-            beam["remaining_duration"] -= delta_time
+            beam.remaining_duration -= delta_time
             
-            if beam["remaining_duration"] <= 0:
-                beam["active"] = False
+            if beam.remaining_duration <= 0:
+                beam.active = False
+                self._beams_expired = True
                 continue
             
-            # Energy beams do continuous PURE JOULE damage
-            beam_start = (beam["start_x"], beam["start_y"])
-            beam_end = (beam["end_x"], beam["end_y"])
-            
-            for enemy in enemies[:]:
-                if not hasattr(enemy, 'x') or not hasattr(enemy, 'y') or not enemy.alive:
+            firing_beams.append(beam)
+        
+        targets, enemy_x, enemy_y, _ = snapshot
+        if not firing_beams or not targets:
+            return
+        
+        # Check beam intersection for every beam/enemy pair at once
+        segments = np.array([(beam.start_x, beam.start_y, beam.end_x, beam.end_y, beam.width)
+                             for beam in firing_beams], dtype=np.float64)
+        hits = _beam_hits(*segments.T, enemy_x, enemy_y)
+        
+        # Energy beams do continuous PURE JOULE damage
+        for beam, row in zip(firing_beams, hits):
+            for target_index in np.flatnonzero(row).tolist():
+                enemy = targets[target_index]
+                if not enemy.alive:
                     continue
                 
-                # Check beam intersection
-                distance_to_beam = self._point_to_line_distance(
-                    (enemy.x, enemy.y), beam_start, beam_end
-                )
+                # Apply continuous PURE JOULE damage (scaled by delta time)
+                damage_joules_per_second = beam.joule_damage
+                damage_this_frame = damage_joules_per_second * delta_time
                 
-                if distance_to_beam < beam["width"]:
-                    # Apply continuous PURE JOULE damage (scaled by delta time)
-                    damage_joules_per_second = beam["joule_damage"]
-                    damage_this_frame = damage_joules_per_second * delta_time
-                    
-                    print(f"Energy beam continuous damage: {damage_this_frame:.0f} J this frame")
-                    enemy.take_damage(damage_this_frame, "energy")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Energy beam continuous damage: %.0f J this frame", damage_this_frame)
+                enemy.take_damage(damage_this_frame, "energy")
     
     def _cleanup_projectiles(self):
         """Remove inactive projectiles and those outside screen bounds"""
-        self.bombs = [bomb for bomb in self.bombs if bomb["active"] and self._is_in_bounds(bomb)]
-        self.kinetic_shots = [shot for shot in self.kinetic_shots if shot["active"] and self._is_in_bounds(shot)]
-        self.energy_beams = [beam for beam in self.energy_beams if beam["active"]]
+        self.bomb_count = self._compact_pool(self.BOMB_POOL_FIELDS, self.bomb_count,
+                                             (self.bomb_warhead_data, self.bomb_stats, self.bomb_group_id))
+        self.shot_count = self._compact_pool(self.SHOT_POOL_FIELDS, self.shot_count, (self.shot_projectile_data,))
+        if self._beams_expired:
+            self._beams_expired = False
+            beams = self.energy_beams
+            write = 0
+            for beam in beams:
+                if beam.active:
+                    beams[write] = beam
+                    write += 1
+            del beams[write:]
+        self.projectile_count = self.bomb_count + self.shot_count + len(self.energy_beams)
     
-    def _is_in_bounds(self, projectile):
-        """Check if projectile is within screen bounds (with margin)"""
+    def _compact_pool(self, fields, count, slot_lists):
+        """Compact a projectile pool down to its active, in-bounds entries and return the new count"""
+        if count == 0:
+            return 0
+        
+        # Pool fields start with x, y, vx, vy, lifetime, active
+        x = getattr(self, fields[0][0])[:count]
+        y = getattr(self, fields[1][0])[:count]
         margin = self.cleanup_margin
-        return (-margin <= projectile["x"] <= self.screen_width + margin and 
-                -margin <= projectile["y"] <= self.screen_height + margin)
+        keep = getattr(self, fields[5][0])[:count].copy()
+        keep &= (x >= -margin) & (x <= self.screen_width + margin)
+        keep &= (y >= -margin) & (y <= self.screen_height + margin)
+        if keep.all():
+            return count
+        
+        live = int(np.count_nonzero(keep))
+        for name, _ in fields:
+            field = getattr(self, name)
+            field[:live] = field[:count][keep]
+        keep_slots = keep.tolist()
+        for values in slot_lists:
+            values[:] = compress(values, keep_slots)
+        return live
     
     def _calculate_explosion_size(self, warhead_data):
         """Calculate visual explosion size based on warhead"""
-        explosive_kg = warhead_data.get("explosive_kg", 0.5)
+        explosive_kg = warhead_data.explosive_kg
         size_multiplier = math.log(explosive_kg + 1) * 0.5
         return 1.0 * (1 + size_multiplier)
     
-    def _point_to_line_distance(self, point, line_start, line_end):
-        """Calculate distance from point to line segment"""
-        px, py = point
-        x1, y1 = line_start
-        x2, y2 = line_end
-        
-        dx = x2 - x1
-        dy = y2 - y1
-        
-        if dx == 0 and dy == 0:
-            return math.hypot(px - x1, py - y1)
-        
-        t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
-        closest_x = x1 + t * dx
-        closest_y = y1 + t * dy
-        
-        return math.hypot(px - closest_x, py - closest_y)
-    
     def draw(self, screen):
         """Render all projectiles with 0.6% screen scaling"""
         # Draw bombs - scaled size
-        for bomb in self.bombs:
-            if bomb["active"]:
-                pygame.draw.circle(screen, (255, 255, 0), (int(bomb["x"]), int(bomb["y"])), bomb["radius"])
+        count = self.bomb_count
+        for x, y, active in zip(self.bomb_x[:count].tolist(), self.bomb_y[:count].tolist(),
+                                self.bomb_active[:count].tolist()):
+            if active:
+                pygame.draw.circle(screen, (255, 255, 0), (int(x), int(y)), self.bomb_radius)
                 
                 # Draw proximity fuse indicator - scaled
                 pygame.draw.circle(screen, (255, 255, 100), 
-                                 (int(bomb["x"]), int(bomb["y"])), 
-                                 bomb["proximity_radius"], 1)
+                                 (int(x), int(y)), 
+                                 self.bomb_proximity_radius, 1)
         
         # Draw kinetic shots - scaled size
-        for shot in self.kinetic_shots:
-            if shot["active"]:
-                color = (0, 255, 255) if shot["is_player_shot"] else (255, 100, 100)
-                pygame.draw.circle(screen, color, (int(shot["x"]), int(shot["y"])), shot["radius"])
+        count = self.shot_count
+        for x, y, active, is_player_shot in zip(self.shot_x[:count].tolist(), self.shot_y[:count].tolist(),
+                                                self.shot_active[:count].tolist(),
+                                                self.shot_is_player[:count].tolist()):
+            if active:
+                color = (0, 255, 255) if is_player_shot else (255, 100, 100)
+                pygame.draw.circle(screen, color, (int(x), int(y)), self.shot_radius)
         
         # Draw energy beams - scaled width
         for beam in self.energy_beams:
-            if beam["active"]:
+            if beam.active:
                 alpha = int(128 + 127 * math.sin(pygame.time.get_ticks() * 0.01))
-                beam_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+                beam_surface = self._beam_surface
+                if beam_surface is None:
+                    beam_surface = self._beam_surface = pygame.Surface((self.screen_width, self.screen_height),
+                                                                       pygame.SRCALPHA)
                 
-                pygame.draw.line(beam_surface, (255, 0, 255, alpha), 
-                               (beam["start_x"], beam["start_y"]), 
-                               (beam["end_x"], beam["end_y"]), beam["width"])
+                # Only the line's bounding rect is blitted, then cleared so the layer stays transparent
+                beam_rect = pygame.draw.line(beam_surface, (255, 0, 255, alpha), 
+                                             (beam.start_x, beam.start_y), 
+                                             (beam.end_x, beam.end_y), beam.width)
                 
-                screen.blit(beam_surface, (0, 0))
+                screen.blit(beam_surface, beam_rect, beam_rect)
+                beam_surface.fill((0, 0, 0, 0), beam_rect)
     
     def get_projectile_count(self):
         """Get total number of active projectiles"""
-        return len([p for p in self.bombs if p["active"]]) + \
-               len([p for p in self.kinetic_shots if p["active"]]) + \
-               len([p for p in self.energy_beams if p["active"]])
+        return self.projectile_count
     
     def clear_all_projectiles(self):
         """Clear all projectiles (for scene transitions)"""
-        self.bombs.clear()
-        self.kinetic_shots.clear()
-        self.energy_beams.clear()
\ No newline at end of file
+        self.bomb_count = 0
+        self.shot_count = 0
+        self.bomb_warhead_data.clear()
+        self.bomb_stats.clear()
+        self.bomb_group_id.clear()
+        self.shot_projectile_data.clear()
+        self.energy_beams.clear()
+        self.projectile_count = 0
\ No newline at end of file
@@ -195,6 +195,7 @@ class UniversalCannon:
             return {
                 "mass_kg": 0.05,  # 50 grams
                 "velocity_kmh": self.projectile_speed * 3.6,  # Convert m/s to km/h
+                "velocity_ms": self.projectile_speed,
                 "diameter_mm": 8,
                 "material": "Tungsten Core",
                 "damage_type": "kinetic"
@@ -203,6 +204,7 @@ class UniversalCannon:
         # Apply cannon level/rarity modifiers
         enhanced_projectile = base_projectile.copy()
         enhanced_projectile["velocity_kmh"] = self.projectile_speed * 3.6
+        enhanced_projectile["velocity_ms"] = self.projectile_speed
         
         # Damage scaling based on cannon level
         damage_multiplier = 1.0 + (self.cannon_level - 1) * 0.15
@@ -357,12 +359,14 @@ class CannonManager:
         
         if shot.is_player_shot:
             # Player shots vs enemies
-            for enemy in enemies[:]:
-                if not hasattr(enemy, 'x') or not hasattr(enemy, 'y') or not enemy.active:
+            for enemy in enemies:
+                if not enemy.active:
                     continue
                 
-                distance = math.hypot(shot.x - enemy.x, shot.y - enemy.y)
-                if distance < collision_radius + enemy.radius:
+                dx = shot.x - enemy.x
+                dy = shot.y - enemy.y
+                hit_distance = collision_radius + enemy.radius
+                if dx * dx + dy * dy < hit_distance * hit_distance:
                     # Hit enemy
                     was_killed = enemy.take_damage(shot.damage, "kinetic")
                     shot.active = False
@@ -375,10 +379,12 @@ class CannonManager:
         else:
             # Enemy shots vs player
             if player_ship and hasattr(player_ship, 'x'):
-                distance = math.hypot(shot.x - player_ship.x, shot.y - player_ship.y)
+                dx = shot.x - player_ship.x
+                dy = shot.y - player_ship.y
                 player_radius = getattr(player_ship, 'collision_radius', 20)
+                hit_distance = collision_radius + player_radius
                 
-                if distance < collision_radius + player_radius:
+                if dx * dx + dy * dy < hit_distance * hit_distance:
                     # Hit player
                     player_ship.take_damage(shot.damage, "kinetic")
                     shot.active = False